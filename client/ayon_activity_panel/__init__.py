@@ -1,33 +1,49 @@
-"""Standalone AYON Activity Panel - Reusable across all DCC applications."""
+"""Standalone AYON Activity Panel - Reusable across all DCC applications.
 
+Public names are resolved lazily on first access (PEP 562) so that importing
+the package does not pull Qt, ayon_core or the API client.
+"""
 from .version import __version__
-from .widget import ActivityPanel
-from .control import ActivityPanelController
-from .abstract import (
-    BackendActivityPanelController,
-    FrontendActivityPanelController,
+
+_LAZY = {
+    "ActivityPanel": (".widget", "ActivityPanel"),
+    "ActivityPanelController": (".control", "ActivityPanelController"),
+    "BackendActivityPanelController": (
+        ".abstract", "BackendActivityPanelController"
+    ),
+    "FrontendActivityPanelController": (
+        ".abstract", "FrontendActivityPanelController"
+    ),
+    "show_activity_panel": (".api.tools", "show_activity_panel"),
+    "ActivityPanelAddon": (".addon", "ActivityPanelAddon"),
+}
+
+__all__ = (
+    "__version__",
+    "ActivityPanelAddon",
+    "ActivityPanel",
+    "ActivityPanelController",
+    "BackendActivityPanelController",
+    "FrontendActivityPanelController",
+    "show_activity_panel",
 )
-from .api.tools import show_activity_panel
 
-try:
-    from .addon import ActivityPanelAddon
 
-    __all__ = (
-        "__version__",
-        "ActivityPanelAddon",
-        "ActivityPanel",
-        "ActivityPanelController",
-        "BackendActivityPanelController",
-        "FrontendActivityPanelController",
-        "show_activity_panel",
-    )
-except ImportError:
-    # ayon_core not available - standalone mode
-    __all__ = (
-        "__version__",
-        "ActivityPanel",
-        "ActivityPanelController",
-        "BackendActivityPanelController",
-        "FrontendActivityPanelController",
-        "show_activity_panel",
-    )
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+
+    import importlib
+
+    module_name, attr = _LAZY[name]
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    except ImportError as exc:
+        # ayon_core not available - standalone mode
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} ({exc})"
+        ) from exc
+    globals()[name] = value
+    return value
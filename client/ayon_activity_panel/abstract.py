@@ -16,6 +16,8 @@ from typing import Optional, Any
 class _BaseActivityPanelController(ABC):
     """Base controller interface with shared methods."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_project_name(self) -> Optional[str]:
         """Get current project name.
@@ -44,11 +46,11 @@ class _BaseActivityPanelController(ABC):
         pass
 
     @abstractmethod
-    def get_available_statuses(self) -> list[dict[str, Any]]:
+    def get_available_statuses(self) -> tuple[dict[str, Any], ...]:
         """Get available statuses for current context.
 
         Returns:
-            List of status dictionaries.
+            Tuple of status dictionaries.
         """
         pass
 
@@ -56,6 +58,8 @@ class _BaseActivityPanelController(ABC):
 class BackendActivityPanelController(_BaseActivityPanelController):
     """Backend controller interface - handles data operations."""
 
+    __slots__ = ()
+
     @abstractmethod
     def set_project(self, project_name: str) -> bool:
         """Set current project and fetch statuses.
@@ -104,6 +108,31 @@ class BackendActivityPanelController(_BaseActivityPanelController):
         """
         pass
 
+    def update_version_statuses_batch(
+            self,
+            version_ids: list[str],
+            new_status: str,
+            is_task: bool = False
+    ) -> bool:
+        """Update status of multiple versions or tasks.
+
+        Default implementation updates them one by one, override to use
+        a single request.
+
+        Args:
+            version_ids: Version or task IDs.
+            new_status: New status value.
+            is_task: Whether updating task statuses.
+
+        Returns:
+            True if all updates were successful.
+        """
+        results = [
+            self.update_version_status(version_id, new_status, is_task)
+            for version_id in version_ids
+        ]
+        return all(results)
+
     @abstractmethod
     def fetch_statuses(self, is_task: bool = False) -> list[dict[str, Any]]:
         """Fetch available statuses.
@@ -156,6 +185,8 @@ class BackendActivityPanelController(_BaseActivityPanelController):
 class FrontendActivityPanelController(_BaseActivityPanelController):
     """Frontend controller interface - handles UI interactions."""
 
+    __slots__ = ()
+
     @abstractmethod
     def register_event_callback(self, topic: str, callback) -> None:
         """Register callback for an event topic.
@@ -10,7 +10,7 @@ No additional pip installations needed if AYON is installed at the default locat
 import sys
 import os
 import json
-import glob
+import fnmatch
 
 os.environ["AYON_SERVER_URL"] = "http://localhost:5000/"
 os.environ["AYON_API_KEY"] = "e6e865e4f0d8ce133ecec8ef26d9fa8a03348e4a7441aa16f6767b921a46734d"
@@ -32,10 +32,12 @@ if os.path.exists(addons_json_path):
     with open(addons_json_path, 'r') as f:
         addons_data = json.load(f)
         for addon_name, versions in addons_data.items():
-            latest_version = max(versions.keys(), key=lambda v: [int(x) for x in v.split('.')])
-            installed_addons[addon_name] = latest_version
+            # Parse each version string once, compare as int tuples
+            parsed = {v: tuple(int(x) for x in v.split('.')) for v in versions}
+            installed_addons[addon_name] = max(parsed, key=parsed.__getitem__)
 
-# Build paths dynamically
+# Build paths dynamically, remembering which ones are already known to exist
+existing_paths = set()
 paths_to_add = [
     os.path.join(ayon_install, "common"),
     os.path.join(ayon_install, "dependencies"),
@@ -46,35 +48,41 @@ if 'core' in installed_addons:
     core_vendor_path = os.path.join(addons_dir, f"core_{installed_addons['core']}", "ayon_core", "vendor", "python")
     paths_to_add.insert(0, core_vendor_path)
 
+
+def _list_dir_names(dirpath, dirs_only=False):
+    """Return entry names of a directory with a single scandir call."""
+    try:
+        with os.scandir(dirpath) as entries:
+            return {
+                entry.name for entry in entries
+                if not dirs_only or entry.is_dir()
+            }
+    except OSError:
+        return set()
+
+
 # Add all installed addons
+addon_dir_names = _list_dir_names(addons_dir, dirs_only=True)
 for addon_name, version in installed_addons.items():
-    addon_dir = os.path.join(addons_dir, f"{addon_name}_{version}")
-    if os.path.exists(addon_dir):
+    addon_dir_name = f"{addon_name}_{version}"
+    if addon_dir_name in addon_dir_names:
+        addon_dir = os.path.join(addons_dir, addon_dir_name)
+        existing_paths.add(addon_dir)
         paths_to_add.append(addon_dir)
 
 # Add dependency packages
-if os.path.exists(dep_packages_dir):
-    for dep_zip in glob.glob(os.path.join(dep_packages_dir, "ayon_*_windows.zip")):
-        dep_path = os.path.join(dep_zip, "dependencies")
-        if os.path.exists(dep_path):
-            paths_to_add.append(dep_path)
-
-for path in paths_to_add:
-    if os.path.exists(path):
+for dep_name in fnmatch.filter(_list_dir_names(dep_packages_dir), "ayon_*_windows.zip"):
+    dep_path = os.path.join(dep_packages_dir, dep_name, "dependencies")
+    if os.path.exists(dep_path):
+        existing_paths.add(dep_path)
+        paths_to_add.append(dep_path)
+
+for path in dict.fromkeys(paths_to_add):
+    if path in existing_paths or os.path.exists(path):
         sys.path.insert(0, path)
 
-sys.path.insert(0, current_dir)
-
-from qtpy.QtWidgets import QApplication, QMainWindow
-from qtpy.QtGui import QIcon
-
-try:
-    from ayon_core.style import load_stylesheet, get_app_icon_path
-except ImportError:
-    load_stylesheet = None
-    get_app_icon_path = None
-
-from ayon_activity_panel.widget import ActivityPanel
+# Put the package's parent dir on sys.path so it imports as a package
+sys.path.insert(0, parent_dir)
 
 if not os.environ.get("AYON_SERVER_URL"):
     print("WARNING: AYON_SERVER_URL not set. Please set environment variables.")
@@ -87,12 +95,34 @@ if not os.environ.get("AYON_API_KEY"):
     sys.exit(1)
 
 
-def run_version_mode():
-    """Run Activity Panel with version ID (Review Browser mode)."""
+def _get_style():
+    """Return (load_stylesheet, get_app_icon_path) or (None, None)."""
+    try:
+        from ayon_core.style import load_stylesheet, get_app_icon_path
+    except ImportError:
+        return None, None
+    return load_stylesheet, get_app_icon_path
+
+
+def _bootstrap_qt(title):
+    """Create styled QApplication and main window.
+
+    Args:
+        title (str): Main window title.
+
+    Returns:
+        tuple: (QApplication, QMainWindow, ActivityPanel)
+    """
+    from qtpy.QtWidgets import QApplication, QMainWindow
+    from qtpy.QtGui import QIcon
+
+    from ayon_activity_panel import ActivityPanel
+
     app = QApplication(sys.argv)
     app.setOrganizationName("AYON")
     app.setApplicationName("ActivityPanel")
 
+    load_stylesheet, get_app_icon_path = _get_style()
     if load_stylesheet:
         app.setStyleSheet(load_stylesheet())
 
@@ -100,45 +130,38 @@ def run_version_mode():
         app.setWindowIcon(QIcon(get_app_icon_path()))
 
     window = QMainWindow()
-    window.setWindowTitle("AYON Activity Panel - Version Mode")
+    window.setWindowTitle(title)
 
     panel = ActivityPanel(bind_rv_events=False)
     window.setCentralWidget(panel)
 
-    panel.set_project("space_project")
-    panel.set_version("59d2fdb600de11f1961ba002a5bd0d80")
-
-    window.resize(800, 600)
-    window.show()
-
     # Save splitter sizes on window close
     def on_close():
         panel._save_splitter_sizes()
 
     window.closeEvent = lambda event: (on_close(), event.accept())
 
-    sys.exit(app.exec_())
+    return app, window, panel
 
 
-def run_dcc_mode():
-    """Run Activity Panel with task ID (DCC mode)."""
-    import ayon_api
+def run_version_mode():
+    """Run Activity Panel with version ID (Review Browser mode)."""
+    app, window, panel = _bootstrap_qt("AYON Activity Panel - Version Mode")
 
-    app = QApplication(sys.argv)
-    app.setOrganizationName("AYON")
-    app.setApplicationName("ActivityPanel")
+    panel.set_project("space_project")
+    panel.set_version("59d2fdb600de11f1961ba002a5bd0d80")
 
-    if load_stylesheet:
-        app.setStyleSheet(load_stylesheet())
+    window.resize(800, 600)
+    window.show()
 
-    if get_app_icon_path:
-        app.setWindowIcon(QIcon(get_app_icon_path()))
+    sys.exit(app.exec_())
 
-    window = QMainWindow()
-    window.setWindowTitle("AYON Activity Panel - DCC Mode")
 
-    panel = ActivityPanel(bind_rv_events=False)
-    window.setCentralWidget(panel)
+def run_dcc_mode():
+    """Run Activity Panel with task ID (DCC mode)."""
+    import ayon_api
+
+    app, window, panel = _bootstrap_qt("AYON Activity Panel - DCC Mode")
 
     # Build DCC mode version_data manually (no version_id key)
     project_name = "space_project"
@@ -165,16 +188,19 @@ def run_dcc_mode():
     window.resize(800, 600)
     window.show()
 
-    # Save splitter sizes on window close
-    def on_close():
-        panel._save_splitter_sizes()
-
-    window.closeEvent = lambda event: (on_close(), event.accept())
-
     sys.exit(app.exec_())
 
 
 def main():
+    # Fail fast if the package would be imported from another location
+    loaded = sys.modules.get("ayon_activity_panel")
+    if loaded is not None:
+        loaded_path = os.path.abspath(loaded.__file__)
+        if os.path.commonpath([loaded_path, parent_dir]) != parent_dir:
+            raise RuntimeError(
+                f"ayon_activity_panel imported from unexpected path: {loaded_path}"
+            )
+
     # Hardcoded test mode: 'version' or 'dcc'
     mode = 'dcc'
 
@@ -18,6 +18,17 @@ except ImportError:
 
 from .version import __version__
 
+_PLUGINS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins")
+_LOAD_PLUGINS_DIR = os.path.join(_PLUGINS_DIR, "load")
+_INVENTORY_PLUGINS_DIR = os.path.join(_PLUGINS_DIR, "inventory")
+
+_DEFAULT_SETTINGS = {
+    'enabled': True,
+    'debounce_delay_ms': 500,
+    'auto_refresh_interval_ms': 300000,
+    'enable_rv_integration': True,
+}
+
 
 class ActivityPanelAddon(AYONAddon, IPluginPaths):
     """Activity Panel addon for AYON.
@@ -34,10 +45,8 @@ class ActivityPanelAddon(AYONAddon, IPluginPaths):
         # Extract activity_panel settings from studio settings
         addon_settings = settings.get(self.name, {})
         self._settings = {
-            'enabled': addon_settings.get('enabled', True),
-            'debounce_delay_ms': addon_settings.get('debounce_delay_ms', 500),
-            'auto_refresh_interval_ms': addon_settings.get('auto_refresh_interval_ms', 300000),
-            'enable_rv_integration': addon_settings.get('enable_rv_integration', True),
+            key: addon_settings.get(key, default)
+            for key, default in _DEFAULT_SETTINGS.items()
         }
 
     def connect_with_addons(self, enabled_addons):
@@ -66,8 +75,7 @@ class ActivityPanelAddon(AYONAddon, IPluginPaths):
         Returns:
             list: List of loader action plugin paths.
         """
-        plugins_dir = os.path.join(os.path.dirname(__file__), "plugins")
-        return [os.path.join(plugins_dir, "load")]
+        return [_LOAD_PLUGINS_DIR]
 
     def get_load_plugin_paths(self, host_name):
         """Return loader plugin paths (deprecated, kept for compatibility).
@@ -89,5 +97,4 @@ class ActivityPanelAddon(AYONAddon, IPluginPaths):
         Returns:
             list: List of inventory action plugin paths.
         """
-        plugins_dir = os.path.join(os.path.dirname(__file__), "plugins")
-        return [os.path.join(plugins_dir, "inventory")]
+        return [_INVENTORY_PLUGINS_DIR]
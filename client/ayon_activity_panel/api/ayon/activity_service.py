@@ -1,49 +1,136 @@
 from __future__ import annotations
 
-import concurrent.futures
-import base64
+import collections
+import json
 import mimetypes
-from typing import Optional, List, Dict, Tuple
+import threading
+import traceback
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple
 from .base_client import BaseAyonClient
+from .cache import TTLCache
 from .file_service import FileService
 
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+
+def get_activity_data(activity: Dict) -> Dict:
+    """Return parsed 'activityData' of an activity node.
+
+    The server may return 'activityData' as a JSON string. The parsed dict
+    is cached on the activity under '_parsed_data' so it is decoded only
+    once, no matter how many times the activity is re-rendered.
+    """
+    data = activity.get('_parsed_data')
+    if data is not None:
+        return data
+
+    data = activity.get('activityData')
+    if isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            data = None
+    if not isinstance(data, dict):
+        data = {}
+    activity['_parsed_data'] = data
+    return data
+
+
+# (project_name, folder_path) -> folder_id or "" if not found
+_folder_id_cache = TTLCache(maxsize=256, ttl=60.0)
+
+
+@lru_cache(maxsize=256)
+def _guess_mime(file_name: str) -> Optional[str]:
+    """Cached mime type lookup by file name."""
+    return mimetypes.guess_type(file_name)[0]
+
+
+@lru_cache(maxsize=1024)
+def _tag(kind: str, label: str, ident: str) -> str:
+    """Build markdown entity tag, e.g. '[v001](version:<id>)'."""
+    return f"[{label}]({kind}:{ident})"
+
 
 class ActivityService(BaseAyonClient):
+    # Shared across instances so batches reuse threads and pooled connections
+    _download_pool = None
+    _download_pool_lock = threading.Lock()
+    # Uploads get their own small pool so they never wait behind thumbnails
+    _upload_pool = None
+    _upload_pool_lock = threading.Lock()
+    # Max downloaded files kept in memory per service instance
+    _file_cache_size = 64
+
     def __init__(self):
         super().__init__()
         self.file_service = FileService()
+        # LRU of (project_name, file_id) -> (bytes, mime_type)
+        self._file_cache = collections.OrderedDict()
+        self._file_cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_download_pool(cls) -> ThreadPoolExecutor:
+        """Get or lazily create the shared download thread pool."""
+        if cls._download_pool is None:
+            with cls._download_pool_lock:
+                if cls._download_pool is None:
+                    # Imported here so comment-only callers never load it
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    cls._download_pool = ThreadPoolExecutor(
+                        max_workers=8, thread_name_prefix="ayon-dl"
+                    )
+        return cls._download_pool
+
+    @classmethod
+    def _get_upload_pool(cls) -> ThreadPoolExecutor:
+        """Get or lazily create the shared upload thread pool."""
+        if cls._upload_pool is None:
+            with cls._upload_pool_lock:
+                if cls._upload_pool is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    cls._upload_pool = ThreadPoolExecutor(
+                        max_workers=2, thread_name_prefix="ayon-ul"
+                    )
+        return cls._upload_pool
+
+    def _download_file(self, project_name: str,
+                       file_info: Dict) -> Tuple[str, Optional[Tuple[bytes, str]]]:
+        """Download single file and return (file_id, (data, mime_type))."""
+        file_id, file_name = file_info['id'], file_info['filename']
+        cache_key = (project_name, file_id)
+        with self._file_cache_lock:
+            cached = self._file_cache.get(cache_key)
+            if cached is not None:
+                self._file_cache.move_to_end(cache_key)
+        if cached is not None:
+            return file_id, cached
 
-    def _download_file_batch(self, project_name: str, file_data: List[Dict]) -> Dict[str, Tuple[str, str]]:
-        """Download files in parallel and return base64 data."""
-        results = {}
-
-        def download_single_file(file_info):
-            file_id, file_name = file_info['id'], file_info['filename']
-            try:
-                response = self.ayon_connection.get(f"/projects/{project_name}/files/{file_id}")
-                if response.status_code == 200:
-                    mime_type, _ = mimetypes.guess_type(file_name)
-                    img_data = base64.b64encode(response.content).decode('utf-8')
-                    # Close response to return connection to pool
-                    if hasattr(response, 'close'):
-                        response.close()
-                    return file_id, (img_data, mime_type)
-                if hasattr(response, 'close'):
-                    response.close()
-                return file_id, None
-            except Exception:
+        try:
+            response = self.ayon_connection.get(f"/projects/{project_name}/files/{file_id}")
+            if response.status_code != 200:
                 return file_id, None
-
-        # Limit concurrent downloads to avoid pool exhaustion
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_file = {executor.submit(download_single_file, file_info): file_info['id']
-                              for file_info in file_data}
-
-            for future in concurrent.futures.as_completed(future_to_file):
-                file_id, result = future.result()
-                results[file_id] = result
-
-        return results
+            # Reading the body returns the connection to the pool
+            img_data = response.content
+        except Exception:
+            return file_id, None
+
+        mime_type = _guess_mime(file_name)
+        with self._file_cache_lock:
+            self._file_cache[cache_key] = (img_data, mime_type)
+            if len(self._file_cache) > self._file_cache_size:
+                self._file_cache.popitem(last=False)
+        return file_id, (img_data, mime_type)
+
+    def get_file_data(self, project_name: str, file_id: str,
+                      filename: str = "") -> Optional[bytes]:
+        """Get bytes of an attachment, from the download cache if possible."""
+        _, result = self._download_file(project_name, {'id': file_id, 'filename': filename})
+        return result[0] if result else None
 
     def create_comment_on_version(self, project_name: str, version_id: str, message: str,
                                   user_name: Optional[str] = None,
@@ -52,6 +139,11 @@ class ActivityService(BaseAyonClient):
                                   task_name: Optional[str] = None,
                                   path: Optional[str] = None,
                                   version_name: Optional[str] = None) -> Optional[List[str]]:
+        """Create comment activity, uploading file_paths as attachments.
+
+        Returns:
+            IDs of attached files, None if the comment was not created.
+        """
         try:
             entity_type, entity_id = self._determine_entity(project_name, version_id, task_id, path)
             formatted_message = self._format_message(message, entity_type, version_id, version_name,
@@ -60,6 +152,9 @@ class ActivityService(BaseAyonClient):
             file_ids = []
             if file_paths:
                 file_ids = self._upload_files(project_name, file_paths)
+                if not file_ids:
+                    print("Error creating comment: no attachment could be uploaded")
+                    return None
 
             self.ayon_connection.create_activity(
                 project_name=project_name,
@@ -75,9 +170,8 @@ class ActivityService(BaseAyonClient):
             # Print response body if available
             if hasattr(e, 'response') and hasattr(e.response, 'text'):
                 print(f"Response body: {e.response.text}")
-            import traceback
             traceback.print_exc()
-            return []
+            return None
 
     def _determine_entity(self, project_name: str, version_id: str,
                           task_id: Optional[str], path: Optional[str]) -> Tuple[str, str]:
@@ -86,47 +180,62 @@ class ActivityService(BaseAyonClient):
             return "task", task_id
 
         if path and path != "N/A":
-            try:
-                folder = self.ayon_connection.get_folder_by_path(project_name, path)
-                if folder and folder.get("id"):
-                    return "folder", folder["id"]
-            except Exception as e:
-                print(f"Error getting folder by path: {e}")
+            folder_id = self._get_folder_id_by_path(project_name, path)
+            if folder_id:
+                return "folder", folder_id
 
         return "version", version_id
 
+    def _get_folder_id_by_path(self, project_name: str, path: str) -> str:
+        """Get folder id for path, cached for a short time."""
+        key = (project_name, path)
+        cached = _folder_id_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            folder = self.ayon_connection.get_folder_by_path(project_name, path)
+        except Exception as e:
+            print(f"Error getting folder by path: {e}")
+            return ""
+
+        folder_id = folder["id"] if folder and folder.get("id") else ""
+        _folder_id_cache.set(key, folder_id)
+        return folder_id
+
     def _format_message(self, message: str, entity_type: str, version_id: str,
                         version_name: Optional[str], task_id: Optional[str],
                         task_name: Optional[str], user_name: Optional[str]) -> str:
         """Format message with version, task, and user tags."""
-        tags = []
+        # Always tag version, task if available, and user
+        version_tag = _tag("version", version_name, version_id) if version_name and version_id else ""
+        task_tag = _tag("task", task_name, task_id) if task_name and task_id and task_id != "N/A" else ""
+        user_tag = _tag("user", user_name, user_name) if user_name else ""
 
-        # Always tag version
-        if version_name and version_id:
-            tags.append(f"[{version_name}](version:{version_id})")
+        prefix = " ".join(tag for tag in (version_tag, task_tag, user_tag) if tag)
+        return f"{prefix}\n{message}" if prefix else message
 
-        # Tag task if available
-        if task_name and task_id and task_id != "N/A":
-            tags.append(f"[{task_name}](task:{task_id})")
-
-        # Tag user
-        if user_name:
-            tags.append(f"[{user_name}](user:{user_name})")
-
-        return f"{' '.join(tags)}\n{message}" if tags else message
+    def _upload_file(self, project_name: str, file_path: str) -> Optional[str]:
+        try:
+            return self.file_service.upload_file(project_name, file_path)
+        except Exception as e:
+            print(f"    ❌ Upload failed: {e}")
+            traceback.print_exc()
+            return None
 
     def _upload_files(self, project_name: str, file_paths: List[str]) -> List[str]:
-        """Upload files and return their IDs."""
-        file_ids = []
-        for fp in file_paths:
-            try:
-                file_id = self.file_service.upload_file(project_name, fp)
-                file_ids.append(file_id)
-            except Exception as e:
-                print(f"    ❌ Upload failed: {e}")
-                import traceback
-                traceback.print_exc()
-        return file_ids
+        """Upload files concurrently and return their IDs.
+
+        Uploads run on the shared upload pool, IDs keep the order of
+        file_paths. Files that failed to upload are left out.
+        """
+        if len(file_paths) == 1:
+            file_ids = [self._upload_file(project_name, file_paths[0])]
+        else:
+            file_ids = self._get_upload_pool().map(
+                lambda fp: self._upload_file(project_name, fp), file_paths
+            )
+        return [file_id for file_id in file_ids if file_id]
 
     def update_activity(self, project_name: str, activity_id: str, body: str) -> bool:
         """Update activity body."""
@@ -139,7 +248,6 @@ class ActivityService(BaseAyonClient):
             return True
         except Exception as e:
             print(f"Error updating activity: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
@@ -169,9 +277,7 @@ class ActivityService(BaseAyonClient):
                     entity_ids.append(task_id)
 
             # Fetch activities
-            from .ayon_client_api import AyonClient
-            client = AyonClient()
-            response = client.get_activities(
+            response = self.get_activities(
                 project_name=project_name,
                 entity_ids=entity_ids,
                 activity_types=['comment', 'status.change', 'version.publish'],
@@ -181,19 +287,28 @@ class ActivityService(BaseAyonClient):
 
             # Extract all activities (no limit)
             activities = []
+            # (activity id, files) of comments with attachments
+            comment_files = []
             page_info = {}
             if response and 'project' in response and response['project']:
-                page_info = response['project'].get('activities', {}).get('pageInfo', {})
-                edges = response['project'].get('activities', {}).get('edges', [])
-                seen_ids = set()
-                for edge in edges:
-                    if edge.get('node'):
-                        activity = edge['node']
-                        activity_id = activity.get('activityId')
-                        if activity_id and activity_id not in seen_ids:
-                            seen_ids.add(activity_id)
-                            activities.append(activity)
-                activities.reverse()
+                activities_response = response['project'].get('activities') or {}
+                page_info = activities_response.get('pageInfo', {})
+                edges = activities_response.get('edges') or ()
+                # Walk newest-first so dict insertion order is already reversed
+                activities_by_id = {}
+                for edge in reversed(edges):
+                    activity = edge.get('node') if edge else None
+                    if not activity:
+                        continue
+                    activity_id = activity.get('activityId')
+                    if not activity_id or activity_id in activities_by_id:
+                        continue
+                    if activity.get('activityType') == 'comment':
+                        files = get_activity_data(activity).get("files")
+                        if files:
+                            comment_files.append((activity_id, files))
+                    activities_by_id[activity_id] = activity
+                activities = list(activities_by_id.values())
         except Exception as e:
             print(f"Error loading activities: {e}")
             return
@@ -207,35 +322,38 @@ class ActivityService(BaseAyonClient):
             'page_info': page_info
         }
 
-        if update_callback:
-            update_callback(activities_data, "activities_ready")
+        if not update_callback:
+            return
+
+        update_callback(activities_data, "activities_ready")
 
         # Load images asynchronously
-        for idx, activity in enumerate(activities):
-            if activity['activityType'] == 'comment':
-                data = activity.get('activityData', {})
-                if isinstance(data, str):
-                    try:
-                        import json
-                        data = json.loads(data)
-                    except:
-                        data = {}
-                files = data.get("files", [])
-                if files and update_callback:
-                    self._load_images_for_activity(project_name, idx, files, update_callback)
-
-    def _load_images_for_activity(self, project_name, activity_index, files, update_callback):
-        """Load images for specific activity."""
-
-        def load_and_update():
-            results = self._download_file_batch(project_name, files)
-            for file_info in files:
-                file_id = file_info['id']
-                filename = file_info.get('filename', 'unknown')
-                result = results.get(file_id)
+        for activity_id, files in comment_files:
+            self._load_images_for_activity(project_name, activity_id, files, update_callback)
+
+    def _load_images_for_activity(self, project_name, activity_id, files, update_callback):
+        """Load images for specific activity on the shared download pool.
+
+        Each file is submitted as its own job; nothing blocks on the pool
+        from inside the pool. Images are reported in attachment order once
+        the last download of the activity finishes.
+        """
+        pool = self._get_download_pool()
+        futures = [pool.submit(self._download_file, project_name, file_info) for file_info in files]
+        pending = set(futures)
+        lock = threading.Lock()
+
+        def on_done(future):
+            with lock:
+                pending.discard(future)
+                if pending:
+                    return
+            for file_info, done_future in zip(files, futures):
+                file_id, result = done_future.result()
                 if result and result[0]:
                     img_data, _ = result
-                    update_callback((activity_index, file_id, img_data, filename), "image_ready")
+                    filename = file_info.get('filename', 'unknown')
+                    update_callback((activity_id, file_id, img_data, filename), "image_ready")
 
-        import threading
-        threading.Thread(target=load_and_update, daemon=True).start()
+        for future in futures:
+            future.add_done_callback(on_done)
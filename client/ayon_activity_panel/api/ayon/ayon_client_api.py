@@ -1,11 +1,10 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, Iterable, List, Dict, Any
 
 from .version_service import VersionService
 from .activity_service import ActivityService
 
 from .file_service import FileService
 
-
 class AyonClient:
     def __init__(self) -> None:
 
@@ -50,65 +49,13 @@ class AyonClient:
     def get_activities(self, project_name: str, entity_ids: List[str],
                        reference_types: List[str] = None,
                        activity_types: List[str] = None,
-                       last: int = 50, before: str = None, dcc_mode: bool = False) -> Dict:
+                       last: int = 50, before: str = None, dcc_mode: bool = False,
+                       fields: Optional[Iterable[str]] = None) -> Dict:
         """Get activity feed/comments (latest activities)"""
-        query = """
-        query GetActivities(
-          $projectName: String!
-          $entityIds: [String!]!
-          $before: String
-          $last: Int
-          $referenceTypes: [String!]
-          $activityTypes: [String!]
-        ) {
-          project(name: $projectName) {
-            name
-            activities(
-              entityIds: $entityIds
-              before: $before
-              last: $last
-              referenceTypes: $referenceTypes
-              activityTypes: $activityTypes
-            ) {
-              pageInfo {
-                hasPreviousPage
-                hasNextPage
-                startCursor
-                endCursor
-              }
-              edges {
-                cursor
-                node {
-                  activityId
-                  activityType
-                  activityData
-                  createdAt
-                  updatedAt
-                  entityId
-                  entityType
-                  projectName
-                  author {
-                    name
-                  }
-                  referenceType
-                  body
-                }
-              }
-            }
-          }
-        }
-        """
-
-        default_ref_types = ['origin', 'mention', 'relation'] if dcc_mode else ['origin', 'mention']
-        result = self.graphql_query(query, {
-            'projectName': project_name,
-            'entityIds': entity_ids,
-            'referenceTypes': reference_types or default_ref_types,
-            'activityTypes': activity_types,
-            'last': last,
-            'before': before
-        })
-        return result.get('data', {}) if result else {}
+        return self.activity_service.get_activities(
+            project_name, entity_ids, reference_types, activity_types,
+            last, before, dcc_mode, fields
+        )
 
     # File operations
     @staticmethod
@@ -9,29 +9,122 @@ Both are required because the codebase uses two different connection methods:
 2. ayon_api library (REST endpoints like get_version_thumbnail, get_activities)
 
 Without both configurations, urllib3 connection pool warnings occur during concurrent operations.
+Both sessions mount adapters backed by the same urllib3 PoolManager, so GraphQL and REST
+calls to the server reuse the same keep-alive sockets.
 """
+import json
 import os
+import threading
 import requests
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Optional, Iterable, List, Dict, Any, Tuple
 from ayon_api import get_server_api_connection
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Activity node fields read by the panel
+_ACTIVITY_FIELDS = (
+    "activityId",
+    "activityType",
+    "activityData",
+    "createdAt",
+    "author { name }",
+    "body",
+)
+
+_QUERY_ACTIVITIES = """
+query GetActivities(
+  $projectName: String!
+  $entityIds: [String!]!
+  $before: String
+  $last: Int
+  $referenceTypes: [String!]
+  $activityTypes: [String!]
+) {
+  project(name: $projectName) {
+    name
+    activities(
+      entityIds: $entityIds
+      before: $before
+      last: $last
+      referenceTypes: $referenceTypes
+      activityTypes: $activityTypes
+    ) {
+      pageInfo {
+        hasPreviousPage
+        hasNextPage
+        startCursor
+        endCursor
+      }
+      edges {
+        node {
+          {fields}
+        }
+      }
+    }
+  }
+}
+"""
+
+
 # Shared session for connection pooling
 _session = None
+_session_lock = threading.Lock()
 _ayon_pool_configured = False
+_ayon_pool_lock = threading.Lock()
+
+# Host-keyed pools shared by every adapter. block=True makes threads wait
+# for a free socket instead of opening throwaway connections.
+_POOL_MANAGER = PoolManager(num_pools=4, maxsize=50, block=True)
+
+# Seconds a thread waits for a free socket before urllib3 raises
+# EmptyPoolError, so a leaked connection can't hang callers forever
+_POOL_TIMEOUT = 30
+
+
+class _HTTPPool(HTTPConnectionPool):
+    """Connection pool that waits at most _POOL_TIMEOUT for a socket."""
+
+    def _get_conn(self, timeout=None):
+        return super()._get_conn(_POOL_TIMEOUT if timeout is None else timeout)
+
+
+class _HTTPSPool(HTTPSConnectionPool):
+    """Connection pool that waits at most _POOL_TIMEOUT for a socket."""
+
+    def _get_conn(self, timeout=None):
+        return super()._get_conn(_POOL_TIMEOUT if timeout is None else timeout)
+
+
+# requests never passes pool_timeout to urlopen, bound the wait in the pools
+_POOL_MANAGER.pool_classes_by_scheme = {"http": _HTTPPool, "https": _HTTPSPool}
+
+
+class _SharedPoolAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter that uses the module-wide PoolManager."""
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _POOL_MANAGER
 
 
 def _create_pool_adapter():
-    """Create HTTPAdapter with large connection pool."""
-    return requests.adapters.HTTPAdapter(
-        pool_connections=50,
-        pool_maxsize=50,
+    """Create HTTPAdapter backed by the shared connection pool."""
+    return _SharedPoolAdapter(
         max_retries=Retry(
             total=3,
             backoff_factor=0.3,
             status_forcelist=[429, 500, 502, 503, 504]
-        ),
-        pool_block=False
+        )
     )
 
 
@@ -42,13 +135,41 @@ def get_requests_session():
     """
     global _session
     if _session is None:
-        _session = requests.Session()
-        adapter = _create_pool_adapter()
-        _session.mount('http://', adapter)
-        _session.mount('https://', adapter)
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = _create_pool_adapter()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session = session
     return _session
 
 
+@lru_cache(maxsize=1)
+def _endpoint() -> Tuple[str, Dict[str, str]]:
+    """Read server URL and API key from environment once.
+
+    Call `_endpoint.cache_clear()` after changing AYON_SERVER_URL or
+    AYON_API_KEY.
+
+    Returns:
+        GraphQL URL and request headers. Callers must not mutate headers.
+    """
+    server_url = os.environ.get("AYON_SERVER_URL", "").rstrip("/")
+    api_key = os.environ.get("AYON_API_KEY", "")
+
+    if not server_url or not api_key:
+        raise Exception("Missing AYON_SERVER_URL or AYON_API_KEY environment variables")
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+    return server_url + "/graphql", headers
+
+
 def configure_ayon_connection_pool(connection):
     """Configure ayon_api connection pool to prevent exhaustion.
 
@@ -59,17 +180,20 @@ def configure_ayon_connection_pool(connection):
     if _ayon_pool_configured or not connection:
         return
 
-    try:
-        # GlobalServerAPI uses _session not session
-        session = getattr(connection, '_session', None) or getattr(connection, 'session', None)
+    with _ayon_pool_lock:
+        if _ayon_pool_configured:
+            return
+        try:
+            # GlobalServerAPI uses _session not session
+            session = getattr(connection, '_session', None) or getattr(connection, 'session', None)
 
-        if session:
-            adapter = _create_pool_adapter()
-            session.mount('http://', adapter)
-            session.mount('https://', adapter)
-            _ayon_pool_configured = True
-    except Exception:
-        pass
+            if session:
+                adapter = _create_pool_adapter()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _ayon_pool_configured = True
+        except Exception:
+            pass
 
 
 class BaseAyonClient:
@@ -92,29 +216,18 @@ class BaseAyonClient:
     @staticmethod
     def graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            url = os.environ.get("AYON_SERVER_URL", "").rstrip("/") + "/graphql"
-            api_key = os.environ.get("AYON_API_KEY", "")
-
-            if not url or not api_key:
-                raise Exception("Missing AYON_SERVER_URL or AYON_API_KEY environment variables")
+            url, headers = _endpoint()
+            payload = {"query": query, "variables": variables}
 
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}"
-            }
-
-            session = get_requests_session()
-            response = session.post(
+            response = get_requests_session().post(
                 url,
-                json={"query": query, "variables": variables},
+                json=payload,
                 headers=headers,
                 timeout=30
             )
             response.raise_for_status()
-            result = response.json()
-            # Explicitly close connection to return to pool
-            response.close()
-            return result
+            # Consuming the body returns the connection to the pool
+            return _json_loads(response.content)
 
         except requests.Timeout:
             raise Exception("Request timeout - server may be unavailable")
@@ -122,3 +235,30 @@ class BaseAyonClient:
             raise Exception(f"Network error: {e}")
         except Exception as e:
             raise Exception(f"GraphQL query failed: {e}")
+
+    def get_activities(self, project_name: str, entity_ids: List[str],
+                       reference_types: List[str] = None,
+                       activity_types: List[str] = None,
+                       last: int = 50, before: str = None, dcc_mode: bool = False,
+                       fields: Optional[Iterable[str]] = None) -> Dict:
+        """Get activity feed/comments (latest activities)
+
+        Args:
+            fields: Activity node fields to select. Defaults to the fields
+                rendered by the panel. Nested selections are passed
+                verbatim, e.g. "author { name }".
+        """
+        query = _QUERY_ACTIVITIES.replace(
+            "{fields}", " ".join(fields or _ACTIVITY_FIELDS)
+        )
+
+        default_ref_types = ['origin', 'mention', 'relation'] if dcc_mode else ['origin', 'mention']
+        result = self.graphql_query(query, {
+            'projectName': project_name,
+            'entityIds': entity_ids,
+            'referenceTypes': reference_types or default_ref_types,
+            'activityTypes': activity_types,
+            'last': last,
+            'before': before
+        })
+        return result.get('data', {}) if result else {}
@@ -1,23 +1,234 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
 import logging
-from typing import Optional, List, Dict, Any
+import os
+import shutil
+import tempfile
+import threading
+from operator import itemgetter
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
+import ayon_api
+
 from .base_client import BaseAyonClient
+from .cache import TTLCache
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Version fields exposed as meta_data by get_version_details
+_META_KEYS = (
+    'hasReviewables', 'productId', 'thumbnailId',
+    'version', 'name', 'status', 'product',
+)
+
+_QUERY_VERSION_DETAILS = """
+query ($project: String!, $version_id: String!) {
+    project(name: $project) {
+        version(id: $version_id) {
+            representations {
+                edges {
+                    node {
+                        attrib {
+                            path
+                            description
+                            frameEnd
+                            frameStart
+                            handleEnd
+                            handleStart
+                            fps
+                        }
+                    }
+                }
+            }
+            thumbnailId
+            version
+            productId
+            product {
+                name
+                folder {
+                    path
+                }
+            }
+            hasReviewables
+            name
+            status
+        }
+    }
+}
+"""
+
+_QUERY_STATUSES = """
+query GetStatuses($projectName: String!) {
+    project(name: $projectName) {
+        statuses {
+            name
+            color
+            icon
+            scope
+        }
+    }
+}
+"""
+
+_QUERY_VERSION_BUNDLE = """
+query VersionBundle($projectName: String!, $versionId: String!) {
+    project(name: $projectName) {
+        version(id: $versionId) {
+            id
+            version
+            status
+            author
+            taskId
+            productId
+            product {
+                name
+                folder {
+                    path
+                }
+                versions {
+                    edges {
+                        node {
+                            id
+                            version
+                            status
+                            author
+                            taskId
+                        }
+                    }
+                }
+            }
+            representations {
+                edges {
+                    node {
+                        id
+                        name
+                        attrib {
+                            path
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+
+# Marks worker threads of VersionService's I/O pool
+_io_pool_thread = threading.local()
+
+
+def _mark_io_pool_thread() -> None:
+    """Initializer of the I/O pool workers."""
+    _io_pool_thread.active = True
+
+
+def _on_io_pool_thread() -> bool:
+    """Whether the current thread is a worker of the I/O pool."""
+    return getattr(_io_pool_thread, "active", False)
+
 
 class VersionService(BaseAyonClient):
+    # Shared by all instances: statuses change rarely, thumbnails are
+    # immutable per version.
+    _status_cache = TTLCache(maxsize=64, ttl=300.0)
+    _thumbnail_cache = TTLCache(maxsize=512, ttl=3600.0)
+    _representation_cache = TTLCache(maxsize=256, ttl=120.0)
+    _io_pool: Optional[ThreadPoolExecutor] = None
+    _io_pool_lock = threading.Lock()
+    _thumbnail_dir: Optional[str] = None
+    _thumbnail_dir_lock = threading.Lock()
+
+    @classmethod
+    def _get_io_pool(cls) -> ThreadPoolExecutor:
+        """Get or lazily create the pool used for independent REST fetches."""
+        if cls._io_pool is None:
+            with cls._io_pool_lock:
+                if cls._io_pool is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    cls._io_pool = ThreadPoolExecutor(
+                        max_workers=8,
+                        thread_name_prefix="ayon-io",
+                        initializer=_mark_io_pool_thread
+                    )
+        return cls._io_pool
+
+    def async_call(self, method_name: str, *args, **kwargs) -> Future:
+        """Run a service method on the shared I/O pool.
+
+        Qt callers should wrap the returned future with
+        `workers.FutureRelay` to receive the result on the main thread.
+
+        Args:
+            method_name: Name of a public VersionService method.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            Future resolving to the method's return value.
+        """
+        method = getattr(self, method_name)
+        return self._get_io_pool().submit(method, *args, **kwargs)
+
+    @classmethod
+    def _get_thumbnail_dir(cls) -> str:
+        """Get or lazily create the per-process thumbnail directory.
+
+        Each version thumbnail is written there once and removed at exit.
+        """
+        if cls._thumbnail_dir is None:
+            with cls._thumbnail_dir_lock:
+                if cls._thumbnail_dir is None:
+                    thumbnail_dir = tempfile.mkdtemp(prefix="ayon-activity-thumbs-")
+                    atexit.register(shutil.rmtree, thumbnail_dir, ignore_errors=True)
+                    cls._thumbnail_dir = thumbnail_dir
+        return cls._thumbnail_dir
+
+    @classmethod
+    def invalidate_statuses(cls, project_name: Optional[str] = None) -> None:
+        """Drop cached statuses of a project, or of all projects."""
+        if project_name is None:
+            cls._status_cache.clear()
+        else:
+            cls._status_cache.pop(project_name)
+
     def get_version_thumbnail_to_local(self, project_name: str, version_id: str) -> Optional[str]:
-        if self.ayon_connection is None:
-            logger.error(f"Connection error: {self.connection_error}")
+        """Write version thumbnail to a local file and return its path.
+
+        Bytes come from `get_version_thumbnail_data`, the file name holds
+        a digest of them so a changed thumbnail never reuses a stale file.
+
+        Returns:
+            Path to the thumbnail file, None if the version has none.
+        """
+        thumbnail_data = self.get_version_thumbnail_data(project_name, version_id)
+        if not thumbnail_data:
             return None
+
         try:
-            thumbnail = self.ayon_connection.get_version_thumbnail(project_name, version_id=version_id)
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as temp_thumb:
-                temp_thumb.write(thumbnail.content)
-                return temp_thumb.name
+            digest = hashlib.sha1(thumbnail_data).hexdigest()[:12]
+            thumbnail_path = os.path.join(
+                self._get_thumbnail_dir(), f"{project_name}_{version_id}_{digest}.jpg"
+            )
+            if os.path.exists(thumbnail_path):
+                return thumbnail_path
+
+            # Write to a private file first so readers never see partial data
+            tmp_path = f"{thumbnail_path}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, "wb") as stream:
+                    stream.write(thumbnail_data)
+                os.replace(tmp_path, thumbnail_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            return thumbnail_path
         except Exception as e:
             logger.error(f"Error getting thumbnail for version {version_id}: {e}")
             return None
@@ -27,9 +238,15 @@ class VersionService(BaseAyonClient):
             logger.error(f"Connection error: {self.connection_error}")
             return None
 
+        cache_key = (project_name, version_id)
+        cached = self._thumbnail_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             thumbnail = self.ayon_connection.get_version_thumbnail(project_name, version_id=version_id)
             if thumbnail and hasattr(thumbnail, 'content'):
+                self._thumbnail_cache.set(cache_key, thumbnail.content)
                 return thumbnail.content
             return None
         except Exception as e:
@@ -38,58 +255,60 @@ class VersionService(BaseAyonClient):
 
     def get_versions_for_product(self, project_name: str, product_id: str) -> List[Dict[str, Any]]:
         try:
-            versions = [version['id'] for version in
-                        list(self.ayon_connection.get_versions(project_name, product_ids=[product_id]))]
-            return versions
+            return [
+                version["id"]
+                for version in self.ayon_connection.get_versions(
+                    project_name, product_ids=[product_id], fields=["id"]
+                )
+            ]
         except Exception as e:
             logger.error(f"Error getting versions for project {project_name}: {e}")
             return []
 
+    def get_version_representations(self, project_name: str, version_id: str) -> List[Dict[str, str]]:
+        """Get id, name and path of version representations.
+
+        Results are cached briefly so prefetched versions open instantly.
+        """
+        try:
+            return self._query_version_representations(project_name, version_id)
+        except Exception as e:
+            logger.error(f"Error getting representations for version {version_id}: {e}")
+            return []
+
+    def _query_version_representations(self, project_name: str, version_id: str) -> List[Dict[str, str]]:
+        """Get cached representations, errors are raised to the caller."""
+        cache_key = (project_name, version_id)
+        cached = self._representation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        representations = [
+            {
+                'id': rep['id'],
+                'name': rep['name'],
+                'path': rep.get('attrib', {}).get('path', '')
+            }
+            for rep in ayon_api.get_representations(
+                project_name,
+                version_ids=[version_id],
+                fields={"id", "name", "attrib.path"}
+            )
+        ]
+        self._representation_cache.set(cache_key, representations)
+        return representations
+
     def get_version_details(self, project_name: str, version_id: str) -> Dict[str, Any]:
         try:
-            query = """
-            query ($project: String!, $version_id: String!) {
-                project(name: $project) {
-                    version(id: $version_id) {
-                        representations {
-                            edges {
-                              node {
-                                attrib {
-                                  path
-                                  description
-                                  frameEnd
-                                  frameStart
-                                  handleEnd
-                                  handleStart
-                                  fps
-                                }
-                              }
-                            }
-                          }
-                          thumbnailId
-                          version
-                          productId
-                          product {
-                            name
-                            folder{
-                              path
-                            }
-                          }
-                          hasReviewables
-                          name
-                          status
-                        }
-                      }
-                    }
-            """
-            result = self.graphql_query(query, {"project": project_name, "version_id": version_id})
+            result = self.graphql_query(_QUERY_VERSION_DETAILS, {"project": project_name, "version_id": version_id})
 
-            if not result or not result.get("data") or not result.get("data").get("project") or not result.get(
-                    "data").get("project").get("version"):
+            try:
+                version_data = result["data"]["project"]["version"]
+            except (KeyError, TypeError):
+                version_data = None
+            if not version_data:
                 return {'representations': [], 'meta_data': {}}
 
-            version_data = result["data"]["project"]["version"]
-
             representations = []
             if version_data.get("representations") and version_data["representations"].get("edges"):
                 representations = [
@@ -99,9 +318,8 @@ class VersionService(BaseAyonClient):
                 ]
 
             meta_data = {
-                key: version_data.get(key, "N/A")
-                for key in ('hasReviewables', 'productId', 'thumbnailId',
-                            'version', 'name', 'status', 'product')
+                key: version_data[key] if key in version_data else "N/A"
+                for key in _META_KEYS
             }
 
             return {
@@ -138,6 +356,42 @@ class VersionService(BaseAyonClient):
             logger.error(f"Error updating task {task_id} status to {status}: {e}")
             return False
 
+    def update_statuses_batch(self, project_name: str, entity_ids: List[str], status: str,
+                              entity_type: str = "version") -> bool:
+        """Update status of multiple versions or tasks in one request.
+
+        Args:
+            project_name: Project name.
+            entity_ids: Version or task ids.
+            status: New status value.
+            entity_type: "version" or "task".
+
+        Returns:
+            True if all entities were updated.
+        """
+        if self.ayon_connection is None:
+            logger.error(f"Connection error: {self.connection_error}")
+            return False
+
+        if not entity_ids:
+            return True
+
+        operations = [
+            {
+                "type": "update",
+                "entityType": entity_type,
+                "entityId": entity_id,
+                "data": {"status": status},
+            }
+            for entity_id in entity_ids
+        ]
+        try:
+            self.ayon_connection.send_batch_operations(project_name, operations)
+            return True
+        except Exception as e:
+            logger.error(f"Error updating {len(entity_ids)} {entity_type} statuses to {status}: {e}")
+            return False
+
     def get_version_reviewables(self, project_name: str, version_id: str) -> List[Dict[str, Any]]:
         """Get reviewables for a version."""
         if self.ayon_connection is None:
@@ -153,77 +407,62 @@ class VersionService(BaseAyonClient):
             logger.error(f"Error getting reviewables for version {version_id}: {e}")
             return []
 
-    def get_version_statuses(self, project_name: str) -> List[Dict[str, str]]:
-        """Get available version statuses for a project."""
+    def get_all_statuses(self, project_name: str) -> Dict[str, List[Dict[str, str]]]:
+        """Get available version and task statuses for a project.
+
+        Returns:
+            Dict with "version" and "task" keys, each a list of statuses.
+            The result is a copy, callers may modify it.
+        """
+        empty = {"version": [], "task": []}
         if self.ayon_connection is None:
             logger.error(f"Connection error: {self.connection_error}")
-            return []
+            return empty
 
         if not project_name:
-            return []
+            return empty
+
+        cached = self._status_cache.get(project_name)
+        if cached is not None:
+            return self._copy_statuses(cached)
 
         try:
-            query = """
-            query GetVersionStatuses($projectName: String!) {
-                project(name: $projectName) {
-                    statuses {
-                        name
-                        color
-                        icon
-                        scope
-                    }
-                }
-            }
-            """
-            result = self.graphql_query(query, {"projectName": project_name})
+            result = self.graphql_query(_QUERY_STATUSES, {"projectName": project_name})
 
-            if result and "data" in result and result["data"].get("project"):
+            try:
                 statuses = result["data"]["project"]["statuses"]
-                return [
-                    {"value": status["name"], "color": status.get("color"), "icon": status.get("icon")}
-                    for status in statuses
-                    if "version" in status.get("scope", [])
-                ]
-            return []
+            except (KeyError, TypeError):
+                return empty
+
+            all_statuses = {"version": [], "task": []}
+            for status in statuses:
+                scope = status.get("scope", [])
+                item = {"value": status["name"], "color": status.get("color"), "icon": status.get("icon")}
+                if "version" in scope:
+                    all_statuses["version"].append(item)
+                if "task" in scope:
+                    all_statuses["task"].append(item)
+            self._status_cache.set(project_name, all_statuses)
+            return self._copy_statuses(all_statuses)
         except Exception as e:
-            logger.error(f"Error getting version statuses for project {project_name}: {e}")
-            return []
-
-    def get_task_statuses(self, project_name: str) -> List[Dict[str, str]]:
-        """Get available task statuses for a project."""
-        if self.ayon_connection is None:
-            logger.error(f"Connection error: {self.connection_error}")
-            return []
+            logger.error(f"Error getting statuses for project {project_name}: {e}")
+            return empty
 
-        if not project_name:
-            return []
+    @staticmethod
+    def _copy_statuses(all_statuses: Dict[str, List[Dict[str, str]]]) -> Dict[str, List[Dict[str, str]]]:
+        """Copy cached statuses so callers can't modify the cache."""
+        return {
+            scope: [dict(status) for status in statuses]
+            for scope, statuses in all_statuses.items()
+        }
 
-        try:
-            query = """
-            query GetTaskStatuses($projectName: String!) {
-                project(name: $projectName) {
-                    statuses {
-                        name
-                        color
-                        icon
-                        scope
-                    }
-                }
-            }
-            """
-            result = self.graphql_query(query, {"projectName": project_name})
+    def get_version_statuses(self, project_name: str) -> List[Dict[str, str]]:
+        """Get available version statuses for a project."""
+        return self.get_all_statuses(project_name)["version"]
 
-            if result and "data" in result and result["data"].get("project"):
-                statuses = result["data"]["project"]["statuses"]
-                return [
-                    {"value": status["name"], "color": status.get("color"), "icon": status.get("icon")}
-                    for status in statuses
-                    if "task" in status.get("scope", [])
-                ]
-            return []
-        except Exception as e:
-            logger.error(f"Error getting task statuses for project {project_name}: {e}")
-            return []
+    def get_task_statuses(self, project_name: str) -> List[Dict[str, str]]:
+        """Get available task statuses for a project."""
+        return self.get_all_statuses(project_name)["task"]
 
     def build_version_data_from_id(self, project_name: str, version_id: str) -> Optional[Dict[str, Any]]:
         """Build complete version_data dictionary from version_id.
@@ -241,64 +480,150 @@ class VersionService(BaseAyonClient):
             logger.error(f"Connection error: {self.connection_error}")
             return None
 
-        try:
-            import ayon_api
+        version_data = self._fetch_version_bundle(project_name, version_id)
+        if version_data is not None:
+            return version_data
 
+        # Fallback to separate REST calls
+        try:
             version = ayon_api.get_version_by_id(project_name, version_id)
             if not version:
                 logger.error(f"Version not found: {version_id}")
                 return None
 
             product_id = version.get("productId")
-            task_id = version.get("taskId")
             folder_path = ""
             product_name = "Unknown"
             all_product_versions = []
             versions_list = []
-            representations = []
-
-            if product_id:
-                product = ayon_api.get_product_by_id(project_name, product_id)
-                if product:
-                    product_name = product.get("name", "Unknown")
-                    folder_id = product.get("folderId")
-                    if folder_id:
-                        folder = ayon_api.get_folder_by_id(project_name, folder_id)
-                        if folder:
-                            folder_path = folder.get("path", "")
-
-                    all_product_versions = list(ayon_api.get_versions(
-                        project_name,
-                        product_ids=[product_id],
-                        fields=["id", "version", "status", "author", "taskId"]
-                    ))
-                    versions_list = [
-                        f"v{v['version']:03d}"
-                        for v in sorted(all_product_versions, key=lambda x: x['version'], reverse=True)
-                    ]
-
-            # Fetch representations
-            for rep in ayon_api.get_representations(project_name, version_ids=[version_id]):
-                representations.append({
-                    'id': rep['id'],
-                    'name': rep['name'],
-                    'path': rep.get('attrib', {}).get('path', '')
-                })
 
-            return {
-                "version_id": version_id,
-                "project_name": project_name,
-                "product_id": product_id,
-                "product_name": product_name,
-                "task_id": task_id,
-                "current_version": f"v{version.get('version', 1):03d}",
-                "version_status": version.get("status", "N/A"),
-                "author": version.get("author", "N/A"),
-                "path": folder_path,
-                "versions": versions_list,
-                "all_product_versions": all_product_versions,
-                "representations": representations,
-            }
+            # Sibling versions and representations do not depend on the
+            # product lookup, fetch them while resolving product and folder.
+            # Blocking on .result() must never happen on an io pool worker
+            # (e.g. when called through async_call()), once every worker
+            # waits on a queued sibling the pool deadlocks. Run the calls
+            # sequentially there instead.
+            reps_future = versions_future = None
+            if not _on_io_pool_thread():
+                pool = self._get_io_pool()
+                reps_future = pool.submit(
+                    self._query_version_representations, project_name, version_id
+                )
+                if product_id:
+                    versions_future = pool.submit(
+                        self._get_sorted_product_versions,
+                        project_name, product_id
+                    )
+
+            try:
+                if product_id:
+                    product = ayon_api.get_product_by_id(project_name, product_id)
+                    if product:
+                        product_name = product.get("name", "Unknown")
+                        folder_id = product.get("folderId")
+                        if folder_id:
+                            folder = ayon_api.get_folder_by_id(project_name, folder_id)
+                            if folder:
+                                folder_path = folder.get("path", "")
+
+                        if versions_future is not None:
+                            all_product_versions = versions_future.result()
+                        else:
+                            all_product_versions = self._get_sorted_product_versions(
+                                project_name, product_id
+                            )
+                        versions_list = [f"v{v['version']:03d}" for v in all_product_versions]
+
+                if reps_future is not None:
+                    representations = reps_future.result()
+                else:
+                    representations = self._query_version_representations(
+                        project_name, version_id
+                    )
+            finally:
+                # Don't leave lookups queued when a step failed or the
+                # product was not found
+                for future in (reps_future, versions_future):
+                    if future is not None:
+                        future.cancel()
+
+            return self._make_version_data(
+                project_name, version_id, version, product_name, folder_path,
+                versions_list, all_product_versions, representations
+            )
         except Exception as e:
             logger.error(f"Error building version data for {version_id}: {e}")
             return None
+
+    @staticmethod
+    def _get_sorted_product_versions(project_name: str, product_id: str) -> List[Dict[str, Any]]:
+        """Get versions of a product, newest first."""
+        return sorted(
+            ayon_api.get_versions(
+                project_name,
+                product_ids=[product_id],
+                fields=["id", "version", "status", "author", "taskId"]
+            ),
+            key=itemgetter("version"),
+            reverse=True
+        )
+
+    def _fetch_version_bundle(self, project_name: str, version_id: str) -> Optional[Dict[str, Any]]:
+        """Build version_data with a single GraphQL query.
+
+        Fetches version, its product, folder path, sibling versions and
+        representations in one round-trip.
+
+        Returns:
+            Complete version_data dict or None if the query failed or
+            returned partial data (caller falls back to REST calls).
+        """
+        try:
+            result = self.graphql_query(_QUERY_VERSION_BUNDLE, {"projectName": project_name, "versionId": version_id})
+            version = result["data"]["project"]["version"]
+            product = version["product"]
+            all_product_versions = sorted(
+                (edge["node"] for edge in product["versions"]["edges"]),
+                key=itemgetter("version"),
+                reverse=True
+            )
+            representations = [
+                {
+                    'id': edge["node"]['id'],
+                    'name': edge["node"]['name'],
+                    'path': (edge["node"].get('attrib') or {}).get('path') or ''
+                }
+                for edge in version["representations"]["edges"]
+            ]
+        except Exception as e:
+            logger.debug(f"Version bundle query failed for {version_id}, using REST fallback: {e}")
+            return None
+
+        versions_list = [f"v{v['version']:03d}" for v in all_product_versions]
+        folder_path = (product.get("folder") or {}).get("path", "")
+
+        return self._make_version_data(
+            project_name, version_id, version, product.get("name", "Unknown"), folder_path,
+            versions_list, all_product_versions, representations
+        )
+
+    @staticmethod
+    def _make_version_data(project_name: str, version_id: str, version: Dict[str, Any],
+                           product_name: str, folder_path: str, versions_list: List[str],
+                           all_product_versions: List[Dict[str, Any]],
+                           representations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Assemble version_data dictionary consumed by the panel."""
+        return {
+            "version_id": version_id,
+            "project_name": project_name,
+            "product_id": version.get("productId"),
+            "product_name": product_name,
+            "task_id": version.get("taskId"),
+            "current_version": f"v{version.get('version', 1):03d}",
+            "version_status": version.get("status", "N/A"),
+            "author": version.get("author", "N/A"),
+            "path": folder_path,
+            "versions": versions_list,
+            "all_product_versions": all_product_versions,
+            "representations": representations,
+        }
@@ -1,7 +1,19 @@
 """Helper tools for showing Activity Panel across different hosts."""
 
+import ayon_api
+from qtpy.QtWidgets import QDockWidget
+from qtpy.QtCore import Qt, QSettings
+
 from ayon_activity_panel.api.lib import qt_app_context
 
+try:
+    from ayon_core.addon import AddonsManager
+    from ayon_core.pipeline import get_current_project_name
+
+    AYON_CORE_AVAILABLE = True
+except ImportError:
+    AYON_CORE_AVAILABLE = False
+
 
 class ActivityPanelHelper:
     """Create and cache Activity Panel dock widget in memory."""
@@ -13,33 +25,24 @@ class ActivityPanelHelper:
     def get_activity_panel_dock(self, parent, project_name=None, bind_rv_events=False):
         """Create, cache and return Activity Panel dock widget."""
         if self._activity_panel_dock is None:
+            # Imported on first use, pulls in the whole UI stack
             from ayon_activity_panel import ActivityPanel
-            from ayon_core.pipeline import get_current_project_name
-            from qtpy.QtWidgets import QDockWidget
-            from qtpy.QtCore import Qt, QSettings
-            import ayon_api
 
-            if project_name is None:
+            if project_name is None and AYON_CORE_AVAILABLE:
                 project_name = get_current_project_name()
 
             # Get addon settings
             settings = {}
             try:
-                from ayon_core.addon import AddonsManager
-                import ayon_api
-
                 manager = AddonsManager()
                 addon = manager.get("activity_panel")
                 if addon and hasattr(addon, 'get_settings'):
                     settings = addon.get_settings()
 
-                if not settings:
-                    from ayon_core.pipeline import get_current_project_name
-                    project_name = get_current_project_name()
-                    if project_name:
-                        settings = ayon_api.get_addon_project_settings(
-                            "activity_panel", project_name
-                        )
+                if not settings and project_name:
+                    settings = ayon_api.get_addon_project_settings(
+                        "activity_panel", project_name
+                    )
             except Exception:
                 pass
 
@@ -7,8 +7,10 @@ Following AYON core architecture pattern:
 """
 from __future__ import annotations
 
+import copy
 from typing import Optional, Any, Callable
 
+import ayon_api
 from ayon_core.lib import Logger
 from ayon_core.lib.events import QueuedEventSystem
 
@@ -17,6 +19,7 @@ from .abstract import (
     FrontendActivityPanelController,
 )
 from .api.ayon.activity_service import ActivityService
+from .api.ayon.cache import TTLCache
 from .api.ayon.version_service import VersionService
 
 log = Logger.get_logger(__name__)
@@ -32,16 +35,31 @@ class ActivityPanelController(
     Coordinates between services and provides event-based communication.
     """
 
+    __slots__ = (
+        "_project_name",
+        "_current_version_id",
+        "_current_version_data",
+        "_available_statuses",
+        "_activity_service",
+        "_version_service",
+        "_build_cache",
+        "_event_system",
+    )
+
     def __init__(self):
         """Initialize controller with services and event system."""
         self._project_name: Optional[str] = None
         self._current_version_id: Optional[str] = None
         self._current_version_data: Optional[dict[str, Any]] = None
-        self._available_statuses: list[dict[str, Any]] = []
+        # Immutable snapshot, handed out to the UI without copying
+        self._available_statuses: tuple[dict[str, Any], ...] = ()
 
         # Services
         self._activity_service = ActivityService()
         self._version_service = VersionService()
+        # (project_name, version_id) -> version_data, the TTL bounds how
+        # long versions published elsewhere stay invisible
+        self._build_cache = TTLCache(maxsize=64, ttl=300.0)
 
         # Event system for frontend communication
         self._event_system = QueuedEventSystem()
@@ -74,7 +92,7 @@ class ActivityPanelController(
         """Get current version data."""
         return self._current_version_data
 
-    def get_available_statuses(self) -> list[dict[str, Any]]:
+    def get_available_statuses(self) -> tuple[dict[str, Any], ...]:
         """Get available statuses for current context."""
         return self._available_statuses
 
@@ -82,14 +100,21 @@ class ActivityPanelController(
     # BackendActivityPanelController implementation
     # -------------------------------------------------------------------------
     def set_project(self, project_name: str) -> bool:
-        """Set current project and fetch statuses."""
+        """Set current project and fetch statuses.
+
+        Version and task statuses of the project are re-fetched here in a
+        single query; later calls to `fetch_statuses` for either scope are
+        served from the VersionService status cache.
+        """
         try:
             self._project_name = project_name
 
             if project_name:
-                statuses = self._version_service.get_version_statuses(project_name)
+                self._version_service.invalidate_statuses(project_name)
+                all_statuses = self._version_service.get_all_statuses(project_name)
+                statuses = all_statuses["version"]
                 if statuses:
-                    self._available_statuses = statuses
+                    self._available_statuses = tuple(statuses)
                     self.emit_event("project.changed", {"project_name": project_name})
                     return True
             return False
@@ -108,6 +133,13 @@ class ActivityPanelController(
             log.error("No project_name provided and no project set")
             return None
 
+        cache_key = (proj, version_id)
+        # Callers modify returned data (e.g. current_representation_path),
+        # cache keeps its own copy
+        cached = self._build_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         try:
             version_data = self._version_service.build_version_data_from_id(
                 proj, version_id
@@ -115,6 +147,7 @@ class ActivityPanelController(
             if not version_data:
                 log.error(f"Failed to build version_data for {version_id}")
                 return None
+            self._build_cache.set(cache_key, copy.deepcopy(version_data))
             return version_data
         except Exception:
             log.error(f"Exception building version data for {version_id}", exc_info=True)
@@ -142,6 +175,8 @@ class ActivityPanelController(
                 )
 
             if success:
+                # Sibling versions embed this status too, drop everything
+                self._build_cache.clear()
                 self.emit_event("status.changed", {
                     "version_id": version_id,
                     "new_status": new_status,
@@ -152,6 +187,36 @@ class ActivityPanelController(
             log.error(f"Failed to update status to {new_status}", exc_info=True)
             return False
 
+    def update_version_statuses_batch(
+            self,
+            version_ids: list[str],
+            new_status: str,
+            is_task: bool = False
+    ) -> bool:
+        """Update status of multiple versions or tasks in one request."""
+        if not self._project_name:
+            log.error("No project set")
+            return False
+
+        try:
+            success = self._version_service.update_statuses_batch(
+                self._project_name,
+                version_ids,
+                new_status,
+                entity_type="task" if is_task else "version"
+            )
+            if success:
+                self._build_cache.clear()
+                self.emit_event("status.changed.bulk", {
+                    "version_ids": list(version_ids),
+                    "new_status": new_status,
+                    "is_task": is_task
+                })
+            return success
+        except Exception:
+            log.error(f"Failed to update statuses to {new_status}", exc_info=True)
+            return False
+
     def fetch_statuses(self, is_task: bool = False) -> list[dict[str, Any]]:
         """Fetch available statuses."""
         if not self._project_name:
@@ -162,7 +227,7 @@ class ActivityPanelController(
                 statuses = self._version_service.get_task_statuses(self._project_name)
             else:
                 statuses = self._version_service.get_version_statuses(self._project_name)
-            self._available_statuses = statuses
+            self._available_statuses = tuple(statuses)
             return statuses
         except Exception:
             log.error("Failed to fetch statuses", exc_info=True)
@@ -189,10 +254,7 @@ class ActivityPanelController(
             if activity_types is None:
                 activity_types = ['comment', 'status.change', 'version.publish']
 
-            # Use activity service to fetch
-            from .api.ayon.ayon_client_api import AyonClient
-            client = AyonClient()
-            response = client.get_activities(
+            response = self._activity_service.get_activities(
                 project_name=self._project_name,
                 entity_ids=entity_ids,
                 activity_types=activity_types,
@@ -214,24 +276,13 @@ class ActivityPanelController(
             current_version_data: Optional[dict[str, Any]] = None
     ) -> dict[str, Any]:
         """Build version data from a version node."""
-        import ayon_api
-
         version_id = version_node.get('id', '')
         current_data = current_version_data or self._current_version_data or {}
 
-        # Fetch representations
-        representations = []
-        try:
-            for rep in ayon_api.get_representations(
-                    self._project_name, version_ids=[version_id]
-            ):
-                representations.append({
-                    'id': rep['id'],
-                    'name': rep['name'],
-                    'path': rep.get('attrib', {}).get('path', '')
-                })
-        except Exception as e:
-            log.error(f"Failed to fetch representations: {e}")
+        # Served from cache when the version was prefetched
+        representations = self._version_service.get_version_representations(
+            self._project_name, version_id
+        )
 
         return {
             'version_id': version_id,
@@ -274,8 +325,24 @@ class ActivityPanelController(
             project_name: Optional[str] = None
     ) -> None:
         """Set current version and notify listeners."""
+        # Nothing changed, skip status fetch and UI refresh
+        if (
+                version_data is not None
+                and version_id == self._current_version_id
+                and version_data == self._current_version_data
+        ):
+            return
+
+        statuses_future = None
         # Auto-build version_data if not provided
         if version_data is None:
+            # Built data is always version mode, so version statuses can
+            # be fetched while the version data is being built
+            proj = project_name or self._project_name
+            if proj:
+                statuses_future = self._version_service.async_call(
+                    "get_version_statuses", proj
+                )
             version_data = self.build_version_data(version_id, project_name)
             if not version_data:
                 log.error(f"Failed to build version_data for {version_id}")
@@ -289,7 +356,10 @@ class ActivityPanelController(
 
         # Check if DCC mode and fetch appropriate statuses
         dcc_mode = 'version_id' not in version_data
-        self._available_statuses = self.fetch_statuses(is_task=dcc_mode)
+        if statuses_future is not None and not dcc_mode:
+            self._available_statuses = tuple(statuses_future.result())
+        else:
+            self._available_statuses = tuple(self.fetch_statuses(is_task=dcc_mode))
 
         # Update state
         self._current_version_id = version_id
@@ -302,11 +372,42 @@ class ActivityPanelController(
             "dcc_mode": dcc_mode
         })
 
+        if not dcc_mode:
+            self._prefetch_adjacent_versions(version_id, version_data)
+
+    def _prefetch_adjacent_versions(
+            self,
+            version_id: str,
+            version_data: dict[str, Any]
+    ) -> None:
+        """Warm representation cache of the previous and next version."""
+        version_ids = [
+            node.get('id') for node in version_data.get('all_product_versions', [])
+        ]
+        if version_id not in version_ids or not self._project_name:
+            return
+
+        idx = version_ids.index(version_id)
+        for adjacent_idx in (idx - 1, idx + 1):
+            if 0 <= adjacent_idx < len(version_ids) and version_ids[adjacent_idx]:
+                self._version_service.async_call(
+                    "get_version_representations",
+                    self._project_name,
+                    version_ids[adjacent_idx]
+                )
+
     def refresh(self) -> None:
         """Refresh current version data and activities."""
         if not self._current_version_id or not self._project_name:
             return
 
+        # Lets the UI start loading activities in the background while
+        # version data is re-fetched below
+        self.emit_event("version.refreshing", {
+            "version_id": self._current_version_id,
+            "version_data": self._current_version_data
+        })
+
         # Check if DCC mode (task-based) from current version data
         dcc_mode = (
                 self._current_version_data and
@@ -318,7 +419,6 @@ class ActivityPanelController(
             task_id = self._current_version_data.get('task_id')
             if task_id:
                 try:
-                    import ayon_api
                     task = ayon_api.get_task_by_id(self._project_name, task_id)
                     if task:
                         self._current_version_data['version_status'] = task.get('status', 'N/A')
@@ -326,6 +426,7 @@ class ActivityPanelController(
                     log.error("Failed to refresh task status", exc_info=True)
         else:
             # Version mode - rebuild version data
+            self._build_cache.pop((self._project_name, self._current_version_id))
             fresh_data = self.build_version_data(
                 self._current_version_id,
                 self._project_name
@@ -1,7 +1,15 @@
 """Review handler for launching OpenRV."""
 
+import ayon_api
 from ayon_core.lib import Logger
 
+try:
+    from ayon_applications import ApplicationManager
+
+    APPLICATIONS_AVAILABLE = True
+except ImportError:
+    APPLICATIONS_AVAILABLE = False
+
 log = Logger.get_logger(__name__)
 
 
@@ -15,6 +23,18 @@ class ReviewHandler:
             parent: Parent ActivityPanel widget.
         """
         self.parent = parent
+        self._openrv_app = None
+
+    def _get_openrv_app(self):
+        """Get latest OpenRV application variant, resolved once.
+
+        Returns:
+            Application or None if OpenRV is not configured.
+        """
+        if self._openrv_app is None:
+            app_manager = ApplicationManager()
+            self._openrv_app = app_manager.find_latest_available_variant_for_group("openrv")
+        return self._openrv_app
 
     def launch_review(self):
         """Launch OpenRV with current context."""
@@ -22,10 +42,11 @@ class ReviewHandler:
             log.warning("No version data available for review")
             return
 
-        try:
-            from ayon_applications import ApplicationManager
-            import ayon_api
+        if not APPLICATIONS_AVAILABLE:
+            log.error("Failed to launch OpenRV: ayon_applications addon is not available")
+            return
 
+        try:
             # Get context from current version data
             folder_path = self.parent.current_version_data.get("path")
             task_name = self.parent.current_version_data.get("task_name")
@@ -43,8 +64,7 @@ class ReviewHandler:
                 return
 
             # Launch OpenRV
-            app_manager = ApplicationManager()
-            openrv_app = app_manager.find_latest_available_variant_for_group("openrv")
+            openrv_app = self._get_openrv_app()
 
             if not openrv_app:
                 log.error("OpenRV not configured. Please configure it in Applications settings.")
@@ -1,5 +1,7 @@
 """Screenshot capture and management handler."""
+import itertools
 import os
+import shutil
 import tempfile
 
 from qtpy.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea, QWidget
@@ -9,6 +11,8 @@ from qtpy.QtGui import QPixmap
 from ayon_core import style
 from ayon_core.lib import Logger
 
+from ..workers import FutureRelay
+
 log = Logger.get_logger(__name__)
 
 
@@ -24,9 +28,28 @@ class ScreenshotHandler:
         """
         self.parent = parent_widget
         self.screenshot_btn = screenshot_button
-        self._pending_screenshots = []
+        # Insertion-ordered set of screenshot paths
+        self._pending_screenshots = {}
+        # path -> Future of the background PNG save
+        self._pending_saves = {}
+        # path -> QPixmap scaled for show_all_preview
+        self._scaled_cache = {}
+        self._save_pool = None
+        # Session directory holding screenshot files, created on first capture
+        self._tmpdir = None
+        self._file_counter = itertools.count(1)
         self.snipping_widget = None
 
+    def _get_save_pool(self):
+        """Get or lazily create single-thread pool for screenshot file I/O."""
+        if self._save_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._save_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ayon-screenshot"
+            )
+        return self._save_pool
+
     def launch_capture(self):
         """Launch screenshot capture tool."""
         main_window = self.parent.window()
@@ -44,16 +67,49 @@ class ScreenshotHandler:
     def _on_screenshot_captured(self):
         """Handle captured screenshot."""
         if self.snipping_widget and self.snipping_widget.captured_pixmap:
-            temp_path = tempfile.mktemp(suffix=".png")
-            if self.snipping_widget.captured_pixmap.save(temp_path, "PNG"):
-                self._pending_screenshots.append(temp_path)
-                self._update_button()
-                self._show_preview(self.snipping_widget.captured_pixmap)
-                log.info(f"Screenshot attached: {temp_path}")
+            pixmap = self.snipping_widget.captured_pixmap
+            if self._tmpdir is None:
+                self._tmpdir = tempfile.mkdtemp(prefix="ayon_ss_")
+            temp_path = os.path.join(self._tmpdir, f"{next(self._file_counter):04d}.png")
+            # Encode off the UI thread, QImage (unlike QPixmap) can be used
+            # from other threads. Qt maps PNG quality to zlib level as
+            # (100 - quality) * 9 / 91, 85 gives level 1: fast to encode,
+            # still compressed for upload
+            future = self._get_save_pool().submit(
+                pixmap.toImage().save, temp_path, "PNG", 85
+            )
+            self._pending_saves[temp_path] = future
+            FutureRelay(
+                future,
+                on_done=lambda saved, path=temp_path: self._on_screenshot_saved(path, saved),
+                on_error=lambda _exc, path=temp_path: self._on_screenshot_saved(path, False),
+                parent=self.parent
+            )
+            self._scaled_cache[temp_path] = pixmap.scaled(
+                500, 300, Qt.KeepAspectRatio, Qt.FastTransformation
+            )
+            self._pending_screenshots[temp_path] = None
+            self._update_button()
+            self._show_preview(pixmap)
+            log.info(f"Screenshot attached: {temp_path}")
         else:
             self._restore_window()
         self.snipping_widget = None
 
+    def _on_screenshot_saved(self, path, saved):
+        """Finish background save of a screenshot."""
+        self._pending_saves.pop(path, None)
+        if path not in self._pending_screenshots:
+            # Cancelled while it was being written, cancel_all queued the
+            # removal behind this save
+            return
+
+        if not saved:
+            log.error(f"Failed to save screenshot: {path}")
+            del self._pending_screenshots[path]
+            self._scaled_cache.pop(path, None)
+            self._update_button()
+
     def _show_preview(self, pixmap):
         """Show screenshot preview dialog."""
         dialog = QDialog(self.parent)
@@ -139,14 +195,13 @@ class ScreenshotHandler:
         scroll_layout = QVBoxLayout(scroll_widget)
 
         for idx, path in enumerate(self._pending_screenshots):
-            pixmap = QPixmap(path)
-            if not pixmap.isNull():
+            scaled = self._get_scaled_preview(path)
+            if scaled is not None:
                 img_label = QLabel()
                 img_label.setAlignment(Qt.AlignCenter)
                 img_label.setStyleSheet(
                     "QLabel { background-color: #2b2b2b; border: 1px solid #3d3d3d; padding: 5px; margin: 5px; }"
                 )
-                scaled = pixmap.scaled(500, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                 img_label.setPixmap(scaled)
                 scroll_layout.addWidget(img_label)
 
@@ -177,16 +232,27 @@ class ScreenshotHandler:
         dialog.resize(540, 600)
         dialog.exec_()
 
+    def _get_scaled_preview(self, path):
+        """Get cached preview pixmap of a screenshot, None if unreadable."""
+        scaled = self._scaled_cache.get(path)
+        if scaled is None:
+            pixmap = QPixmap(path)
+            if pixmap.isNull():
+                return None
+            scaled = pixmap.scaled(500, 300, Qt.KeepAspectRatio, Qt.FastTransformation)
+            self._scaled_cache[path] = scaled
+        return scaled
+
     def cancel_all(self):
         """Cancel all pending screenshots."""
-        for path in self._pending_screenshots:
-            try:
-                if os.path.exists(path):
-                    os.remove(path)
-            except Exception as e:
-                log.warning(f"Failed to remove temp file {path}: {e}")
-        self._pending_screenshots = []
+        self._pending_screenshots = {}
+        self._scaled_cache.clear()
         self._update_button()
+        if self._tmpdir is not None:
+            # Single worker pool runs this after any save still in progress,
+            # next capture starts a new directory
+            self._get_save_pool().submit(shutil.rmtree, self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
 
     def _update_button(self):
         """Update screenshot button to show count."""
@@ -207,13 +273,72 @@ class ScreenshotHandler:
 
     def get_screenshot_paths(self):
         """Get list of pending screenshot paths.
-        
+
+        Waits for screenshots still being written to disk.
+
         Returns:
             list: List of screenshot file paths
         """
-        return self._pending_screenshots.copy()
+        paths = []
+        for path in self._pending_screenshots:
+            future = self._pending_saves.get(path)
+            if future is not None:
+                try:
+                    if not future.result():
+                        continue
+                except Exception:
+                    continue
+            paths.append(path)
+        return paths
+
+    def take_screenshots(self):
+        """Hand pending screenshots over to a comment upload.
+
+        The handler forgets the files and starts a new directory on next
+        capture, so cancel_all() can't remove files the upload still reads.
+        The caller gets back the directory and passes it to
+        discard_screenshots() or restore_screenshots() when done.
+
+        Returns:
+            tuple[list, Optional[str]]: Screenshot paths and their directory.
+        """
+        paths = self.get_screenshot_paths()
+        tmpdir = self._tmpdir
+        self._tmpdir = None
+        self.clear_screenshots()
+        return paths, tmpdir
+
+    def discard_screenshots(self, tmpdir):
+        """Remove directory of screenshots taken by take_screenshots()."""
+        if tmpdir is not None:
+            self._get_save_pool().submit(shutil.rmtree, tmpdir, ignore_errors=True)
+
+    def restore_screenshots(self, paths, tmpdir):
+        """Give back screenshots taken by take_screenshots(), e.g. to resend."""
+        if tmpdir is None:
+            return
+        if self._tmpdir is None:
+            self._tmpdir = tmpdir
+        else:
+            # Captured again meanwhile, file names come from one counter so
+            # the restored files can join the current directory
+            moved = []
+            for path in paths:
+                new_path = os.path.join(self._tmpdir, os.path.basename(path))
+                try:
+                    os.replace(path, new_path)
+                except OSError:
+                    continue
+                moved.append(new_path)
+            self.discard_screenshots(tmpdir)
+            paths = moved
+        restored = dict.fromkeys(paths)
+        restored.update(self._pending_screenshots)
+        self._pending_screenshots = restored
+        self._update_button()
 
     def clear_screenshots(self):
         """Clear all pending screenshots."""
-        self._pending_screenshots = []
+        self._pending_screenshots = {}
+        self._scaled_cache.clear()
         self._update_button()
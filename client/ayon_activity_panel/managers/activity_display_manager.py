@@ -1,18 +1,88 @@
 """Activity display manager."""
-import base64
+import re
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
 
-from qtpy.QtCore import Qt
-from qtpy.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton
-from qtpy.QtGui import QPixmap
+from qtpy.QtCore import QTimer
 from qtmaterialsymbols import get_icon
 
 from ayon_core.lib import Logger
 
-from ..workers import ActivityWorker
+from ..api.ayon.activity_service import get_activity_data
+from ..workers import ActivityWorker, PaginationWorker
 from ..ui import WebLikeActivityRenderer, AnnotationsDialog
+from ..ui.pixmap_cache import find_pixmap, get_pixmap
 
 log = Logger.get_logger(__name__)
 
+_CHECKLIST_RE = re.compile(r'\*\s*\[[ x]\]')
+_CHECKLIST_ITEM_RE = re.compile(r'\*\s*\[([x ])\]\s*(.+)')
+# [text](type:id) tag anywhere in body
+_TAG_RE = re.compile(r'\[([^\]]+)\]\(([^:]+):([^\)]+)\)')
+
+
+_FILTER_BAR_STYLE = """
+    #activityFilterBar QPushButton {
+        background-color: #434a56;
+        border: 1px solid #373D48;
+        border-radius: 0.2em;
+        padding: 6px 12px;
+        color: #99A3B2;
+    }
+    #activityFilterBar QPushButton:hover {
+        background-color: #515661;
+        color: #F0F2F5;
+    }
+    #activityFilterBar QPushButton:checked {
+        background-color: rgba(92, 173, 214, .4);
+        border: 1px solid rgb(92, 173, 214);
+        color: #ffffff;
+    }
+"""
+
+
+@lru_cache(maxsize=32)
+def _get_icon(name, color='#99A3B2'):
+    """Material symbol icon, shared by all panel instances."""
+    return get_icon(name, color=color)
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(iso_timestamp):
+    """Parse ISO timestamp once, with its clock time pre-formatted.
+
+    Returns:
+        tuple: (datetime, clock time, full date) or None if invalid.
+    """
+    try:
+        dt = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
+    return dt, dt.strftime('%I:%M %p'), dt.strftime("%b %d, %Y, %I:%M %p")
+
+
+@lru_cache(maxsize=64)
+def _parse_checklist_items(body):
+    """Parse checklist items of a comment body.
+
+    Returns:
+        tuple: (checked, text, offset) per item, offset is the position of
+            the item's '[' in body.
+    """
+    items = []
+    line_start = 0
+    for line in body.split('\n'):
+        stripped = line.lstrip()
+        match = _CHECKLIST_ITEM_RE.match(stripped.rstrip())
+        if match:
+            checked = match.group(1).lower() == 'x'
+            text = match.group(2).strip()
+            offset = line_start + len(line) - len(stripped) + match.start(1) - 1
+            items.append((checked, text, offset))
+        line_start += len(line) + 1
+    return tuple(items)
+
 
 class ActivityDisplayManager:
     """Manages activity display and updates."""
@@ -29,12 +99,31 @@ class ActivityDisplayManager:
         self.parent = parent
         self.activity_service = activity_service
         self.worker = None
+        self.pagination_worker = None
         self.current_fetch_version = 0
-        self.image_cache = {}
-        self.activity_images = {}  # Track images per activity: {activity_index: [(file_id, filename, img_data)]}
-        self.all_activities = []  # Store all activities
+        # Images per activity id, kept by id because prepended pages shift
+        # activity indexes: {activity_id: [(file_id, filename), ...]}
+        # Bytes live in the activity service download cache, decoded
+        # pixmaps in QPixmapCache, see ui.pixmap_cache
+        self.activity_images = {}
+        # All loaded activities, oldest first, older pages are prepended
+        self.all_activities = deque()
+        # activity_id -> index in all_activities
+        self._activity_indexes = {}
         self.current_filter = 'all'  # 'all', 'comments', 'published', 'checklists'
         self._is_loading_more = False
+        self._pending_scroll = False
+        # Context of the displayed version, set when activities arrive
+        self._project_name = None
+        self._status_colors = {}
+        self._product_name = 'Unknown'
+        self._current_version = 'v000'
+        self._server_url = None
+        self._render_dispatch = {
+            'status.change': self._render_status_change,
+            'version.publish': self._render_version_publish,
+            'comment': self._render_comment,
+        }
 
         # Pagination state
         self._has_previous_page = False
@@ -63,36 +152,14 @@ class ActivityDisplayManager:
         self.ui.checklistsButton.clicked.connect(lambda: self._on_filter_changed('checklists'))
 
         # Set icons for filter buttons
-        self.ui.allActivityButton.setIcon(get_icon('view_list', color='#99A3B2'))
-        self.ui.commentsButton.setIcon(get_icon('comment', color='#99A3B2'))
-        self.ui.publishedVersionsButton.setIcon(get_icon('publish', color='#99A3B2'))
-        self.ui.checklistsButton.setIcon(get_icon('checklist', color='#99A3B2'))
-        self.ui.refreshButton.setIcon(get_icon('refresh', color='#99A3B2'))
-
-        # Style filter buttons using AYON colors
-        button_style = """
-            QPushButton {
-                background-color: #434a56;
-                border: 1px solid #373D48;
-                border-radius: 0.2em;
-                padding: 6px 12px;
-                color: #99A3B2;
-            }
-            QPushButton:hover {
-                background-color: #515661;
-                color: #F0F2F5;
-            }
-            QPushButton:checked {
-                background-color: rgba(92, 173, 214, .4);
-                border: 1px solid rgb(92, 173, 214);
-                color: #ffffff;
-            }
-        """
-        self.ui.allActivityButton.setStyleSheet(button_style)
-        self.ui.commentsButton.setStyleSheet(button_style)
-        self.ui.publishedVersionsButton.setStyleSheet(button_style)
-        self.ui.checklistsButton.setStyleSheet(button_style)
-        self.ui.refreshButton.setStyleSheet(button_style)
+        self.ui.allActivityButton.setIcon(_get_icon('view_list'))
+        self.ui.commentsButton.setIcon(_get_icon('comment'))
+        self.ui.publishedVersionsButton.setIcon(_get_icon('publish'))
+        self.ui.checklistsButton.setIcon(_get_icon('checklist'))
+        self.ui.refreshButton.setIcon(_get_icon('refresh'))
+
+        # Style filter buttons using AYON colors, parsed once for the bar
+        self.ui.activityFilterBar.setStyleSheet(_FILTER_BAR_STYLE)
 
     def fetch_and_display(self, version_id, version_data, project_name, available_statuses):
         """Fetch and display activities.
@@ -110,6 +177,8 @@ class ActivityDisplayManager:
         try:
             self.current_fetch_version += 1
             fetch_id = self.current_fetch_version
+            # Page still loading for the previous version is dropped
+            self._is_loading_more = False
 
             if self.worker and self.worker.isRunning():
                 self.worker.cancel()
@@ -118,6 +187,7 @@ class ActivityDisplayManager:
 
             status_colors = {s.get('value', ''): s.get('color', '#ffffff') for s in available_statuses}
             self._status_colors = status_colors
+            self._project_name = project_name
 
             self.worker = ActivityWorker(
                 self.activity_service, version_id, version_data.get('task_id'),
@@ -139,7 +209,9 @@ class ActivityDisplayManager:
         if not activities_data:
             return
 
-        self.all_activities = activities_data.get('activities', [])
+        self.all_activities = deque(activities_data.get('activities', []))
+        self.activity_images = {}
+        self._index_activities()
         self._product_name = activities_data.get('product_name', 'Unknown')
         self._current_version = activities_data.get('current_version', 'v000')
 
@@ -151,6 +223,13 @@ class ActivityDisplayManager:
 
         self._apply_filter()
 
+    def _index_activities(self):
+        """Map activity ids to their current index in all_activities."""
+        self._activity_indexes = {
+            activity.get('activityId'): idx
+            for idx, activity in enumerate(self.all_activities)
+        }
+
     def _on_filter_changed(self, filter_type):
         """Handle filter button clicks."""
         self.current_filter = filter_type
@@ -170,160 +249,208 @@ class ActivityDisplayManager:
         if not self.all_activities:
             return
 
-        filtered_activities = self._filter_activities(self.all_activities)
-        self._render_filtered_activities(filtered_activities)
-        self.renderer.scroll_to_bottom()
+        self._render_filtered_activities(self.all_activities)
+        self._schedule_scroll_to_bottom()
 
-    def _filter_activities(self, activities):
-        """Filter activities based on current filter."""
+    def _passes_filter(self, activity):
+        """Check if activity is shown by current filter."""
+        activity_type = activity.get('activityType')
         if self.current_filter == 'all':
-            return [a for a in activities if a.get('activityType') in ['comment', 'status.change', 'version.publish']]
+            return activity_type in ('comment', 'status.change', 'version.publish')
         elif self.current_filter == 'comments':
-            return [a for a in activities if a.get('activityType') == 'comment' and not self._is_checklist(a)]
+            return activity_type == 'comment' and not self._is_checklist(activity)
         elif self.current_filter == 'published':
-            return [a for a in activities if a.get('activityType') == 'version.publish']
+            return activity_type == 'version.publish'
         elif self.current_filter == 'checklists':
-            return [a for a in activities if a.get('activityType') == 'comment' and self._is_checklist(a)]
-        return activities
+            return activity_type == 'comment' and self._is_checklist(activity)
+        return True
 
     def _is_checklist(self, activity):
-        """Check if activity is a checklist."""
-        body = activity.get('body', '')
-        import re
-        return bool(re.search(r'\*\s*\[[ x]\]', body))
+        """Check if activity is a checklist.
+
+        Result is cached on the activity dict, filtering and rendering both
+        ask for it on every filter change.
+        """
+        is_checklist = activity.get('_checklist_cached')
+        if is_checklist is None:
+            body = activity.get('body', '')
+            # Plain substring scan rules out most comments without the regex
+            is_checklist = (
+                ('[ ]' in body or '[x]' in body)
+                and _CHECKLIST_RE.search(body) is not None
+            )
+            activity['_checklist_cached'] = is_checklist
+        return is_checklist
 
     def _render_filtered_activities(self, activities):
-        """Render filtered activities."""
-        status_colors = getattr(self, '_status_colors', {})
+        """Render activities that pass current filter.
+
+        Activity index is the position in the unfiltered list, see
+        _activity_indexes for mapping attachments to it.
+        """
+        now = datetime.now(timezone.utc)
 
         for idx, activity in enumerate(activities):
-            activity_type = activity.get('activityType')
+            if not self._passes_filter(activity):
+                continue
+
+            handler = self._render_dispatch.get(activity.get('activityType'))
+            if handler is None:
+                continue
             author = activity.get('author', {}).get('name', 'Unknown')
-            timestamp = self._format_timestamp(activity.get('createdAt', ''))
-            activity_id = activity.get('activityId')
-
-            if activity_type == 'status.change':
-                data = activity.get('activityData', {})
-                if isinstance(data, str):
-                    try:
-                        import json
-                        data = json.loads(data)
-                    except:
-                        data = {}
-
-                old_status = data.get('oldValue', 'N/A')
-                new_status = data.get('newValue', 'N/A')
-                old_color = status_colors.get(old_status)
-                new_color = status_colors.get(new_status)
-
-                origin = data.get('origin', {})
-                origin_type = origin.get('type', '')
-
-                if origin_type == 'task':
-                    task_label = origin.get('label', origin.get('name', 'Unknown'))
-                    self.renderer.add_task_status_change(
-                        author, task_label,
-                        old_status, new_status, timestamp,
-                        old_color, new_color
-                    )
-                else:
-                    # Extract version-specific data from THIS activity
-                    parents = data.get('parents', [])
-                    activity_product = parents[1].get('name', 'Unknown') if len(parents) > 1 else getattr(self,
-                                                                                                          '_product_name',
-                                                                                                          'Unknown')
-                    activity_version = origin.get('name', getattr(self, '_current_version', 'v000'))
-
-                    self.renderer.add_status_change(
-                        author, activity_product, activity_version,
-                        old_status, new_status, timestamp,
-                        old_color, new_color
-                    )
-
-            elif activity_type == 'version.publish':
-                data = activity.get('activityData', {})
-                if isinstance(data, str):
-                    try:
-                        import json
-                        data = json.loads(data)
-                    except:
-                        data = {}
-
-                # Extract from THIS activity
-                context = data.get('context', {})
-                activity_product = context.get('productName', getattr(self, '_product_name', 'Unknown'))
-                origin = data.get('origin', {})
-                activity_version = origin.get('name', getattr(self, '_current_version', 'v000'))
-
-                self.renderer.add_version_publish(author, activity_product, activity_version, timestamp)
-
-            elif activity_type == 'comment':
-                body = activity.get('body', '')
-                if self._is_checklist(activity):
-                    checklist_items = self._parse_checklist(body)
-                    self.renderer.add_checklist(author, timestamp, checklist_items, activity_index=idx,
-                                                activity_id=activity_id, body=body)
-                else:
-                    tags = self._extract_tags(body)
-                    message = self._extract_message(body)
-                    self.renderer.add_comment(author, timestamp, message, tags=tags, activity_index=idx)
+            timestamp = self._format_timestamp(activity.get('createdAt', ''), now)
+            handler(idx, activity, author, timestamp)
+
+    def _render_status_change(self, idx, activity, author, timestamp):
+        """Render status change activity."""
+        data = get_activity_data(activity)
+
+        old_status = data.get('oldValue', 'N/A')
+        new_status = data.get('newValue', 'N/A')
+        old_color = self._status_colors.get(old_status)
+        new_color = self._status_colors.get(new_status)
+
+        origin = data.get('origin', {})
+        origin_type = origin.get('type', '')
+
+        if origin_type == 'task':
+            task_label = origin.get('label', origin.get('name', 'Unknown'))
+            self.renderer.add_task_status_change(
+                author, task_label,
+                old_status, new_status, timestamp,
+                old_color, new_color
+            )
+            return
+
+        # Extract version-specific data from THIS activity
+        parents = data.get('parents', [])
+        activity_product = parents[1].get('name', 'Unknown') if len(parents) > 1 else self._product_name
+        activity_version = origin.get('name', self._current_version)
+
+        self.renderer.add_status_change(
+            author, activity_product, activity_version,
+            old_status, new_status, timestamp,
+            old_color, new_color
+        )
+
+    def _render_version_publish(self, idx, activity, author, timestamp):
+        """Render version publish activity."""
+        data = get_activity_data(activity)
+
+        # Extract from THIS activity
+        context = data.get('context', {})
+        activity_product = context.get('productName', self._product_name)
+        origin = data.get('origin', {})
+        activity_version = origin.get('name', self._current_version)
+
+        self.renderer.add_version_publish(author, activity_product, activity_version, timestamp)
+
+    def _render_comment(self, idx, activity, author, timestamp):
+        """Render comment or checklist activity."""
+        body = activity.get('body', '')
+        if self._is_checklist(activity):
+            checklist_items = self._parse_checklist(body)
+            self.renderer.add_checklist(author, timestamp, checklist_items, activity_index=idx,
+                                        activity_id=activity.get('activityId'), body=body)
+        else:
+            message, tags = self._process_comment_body(body)
+            self.renderer.add_comment(author, timestamp, message, tags=tags, activity_index=idx)
+            # Thumbnails that arrived before this re-render
+            for file_id, filename in self.activity_images.get(activity.get('activityId'), ()):
+                self._add_thumbnail(idx, file_id, filename)
 
     def _parse_checklist(self, body):
         """Parse checklist from body."""
-        import re
-        items = []
-        for line in body.split('\n'):
-            match = re.match(r'\*\s*\[([x ])\]\s*(.+)', line.strip())
-            if match:
-                checked = match.group(1).lower() == 'x'
-                text = match.group(2).strip()
-                items.append((checked, text))
-        return items
+        return [(checked, text) for checked, text, _offset in _parse_checklist_items(body)]
 
     def _inject_thumbnail(self, data):
         """Inject thumbnail into comment card."""
         if not isinstance(data, tuple) or len(data) < 4:
             return
 
-        try:
-            activity_index, file_id, img_data, filename = data[0], data[1], data[2], data[3]
-
-            # Cache for preview
-            self.image_cache[file_id] = img_data
-
-            # Track images per activity for gallery view
-            if activity_index not in self.activity_images:
-                self.activity_images[activity_index] = []
-            self.activity_images[activity_index].append((file_id, filename, img_data))
-
-            # Convert base64 to QPixmap
-            pixmap = QPixmap()
-            if pixmap.loadFromData(base64.b64decode(img_data)):
-                self.renderer.add_thumbnail_to_comment(
-                    activity_index, pixmap,
-                    tooltip="Click to preview",
-                    file_id=file_id,
-                    filename=filename
-                )
-                self.renderer.scroll_to_bottom()
-        except Exception:
-            log.error(f"Failed to inject thumbnail for file {file_id if 'file_id' in locals() else 'unknown'}",
-                      exc_info=True)
+        activity_id, file_id, filename, image = data[:4]
+
+        activity_index = self._activity_indexes.get(activity_id)
+        if activity_index is None:
+            # Image of activities that are no longer displayed
+            return
+
+        # Track images per activity for gallery view
+        self.activity_images.setdefault(activity_id, []).append((file_id, filename))
+
+        if self._add_thumbnail(activity_index, file_id, filename, image):
+            self._schedule_scroll_to_bottom()
+
+    def _get_file_data(self, file_id, filename):
+        """Get attachment bytes from the activity service download cache."""
+        if not self._project_name:
+            return None
+        return self.activity_service.get_file_data(self._project_name, file_id, filename)
+
+    def _add_thumbnail(self, activity_index, file_id, filename, image=None):
+        """Add thumbnail to comment card, return False if undecodable."""
+        if image is not None:
+            pixmap = get_pixmap(file_id, b"", image)
+        else:
+            pixmap = find_pixmap(file_id)
+            if pixmap is None:
+                pixmap = get_pixmap(file_id, self._get_file_data(file_id, filename) or b"")
+        # Undecodable data gives null pixmap, no exception to guard against
+        if pixmap.isNull():
+            log.warning(f"Failed to decode thumbnail for file {file_id}")
+            return False
+
+        self.renderer.add_thumbnail_to_comment(
+            activity_index, pixmap,
+            tooltip="Click to preview",
+            file_id=file_id,
+            filename=filename
+        )
+        return True
+
+    def _schedule_scroll_to_bottom(self):
+        """Scroll to bottom once per event loop turn.
+
+        Thumbnails arrive in bursts, scrolling after each one would relayout
+        the renderer for every image.
+        """
+        if not self._pending_scroll:
+            self._pending_scroll = True
+            QTimer.singleShot(0, self._do_scroll_to_bottom)
+
+    def _do_scroll_to_bottom(self):
+        if not self._pending_scroll:
+            # Cancelled, e.g. older page was prepended above the view
+            return
+        self._pending_scroll = False
+        self.renderer.scroll_to_bottom()
 
     def _on_thumbnail_clicked(self, file_id, activity_index):
         """Handle thumbnail click - open annotations dialog."""
-        if activity_index not in self.activity_images:
+        if not 0 <= activity_index < len(self.all_activities):
             return
 
-        images = self.activity_images[activity_index]
+        activity_id = self.all_activities[activity_index].get('activityId')
+        images = []
+        for image_file_id, filename in self.activity_images.get(activity_id, ()):
+            img_data = self._get_file_data(image_file_id, filename)
+            if img_data:
+                images.append((image_file_id, filename, img_data))
+        if not images:
+            return
         current_index = next((i for i, (fid, _, _) in enumerate(images) if fid == file_id), 0)
 
         dialog = AnnotationsDialog(images, current_index, self.parent)
         dialog.exec_()
 
-    def _format_timestamp(self, iso_timestamp):
+    def _format_timestamp(self, iso_timestamp, now=None):
         """Format ISO timestamp to relative time.
-        
+
+        Args:
+            iso_timestamp (str): ISO timestamp.
+            now (Optional[datetime]): Current UTC time, pass it when formatting
+                many timestamps at once.
+
         Examples:
             - "just now" (< 1 minute)
             - "5m ago" (5 minutes ago)
@@ -335,10 +462,14 @@ class ActivityDisplayManager:
         if not iso_timestamp:
             return "Unknown time"
 
-        try:
-            from datetime import datetime, timezone
-            dt = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
+        parsed = _parse_timestamp(iso_timestamp)
+        if parsed is None:
+            return iso_timestamp
+        dt, clock_time, full_date = parsed
+        if now is None:
             now = datetime.now(timezone.utc)
+
+        try:
             diff = now - dt
 
             seconds = diff.total_seconds()
@@ -352,40 +483,37 @@ class ActivityDisplayManager:
                 hours = int(seconds / 3600)
                 return f"{hours}hr ago" if hours == 1 else f"{hours}hrs ago"
             elif days == 1:
-                return f"yesterday{dt.strftime(' at %I:%M %p')}"
+                return f"yesterday at {clock_time}"
             else:
-                return dt.strftime("%b %d, %Y, %I:%M %p")
+                return full_date
         except:
             return iso_timestamp
 
-    def _extract_tags(self, body):
-        """Extract tags from body. Returns list of (tag_text, tag_type) tuples."""
-        import re
-        tags = []
-
-        # Match [text](type:id) pattern anywhere in body
-        pattern = r'\[([^\]]+)\]\(([^:]+):([^\)]+)\)'
-        matches = re.findall(pattern, body)
+    def _get_server_url(self):
+        """AYON server URL without trailing slash, resolved once."""
+        if self._server_url is None:
+            import ayon_api
 
-        for text, tag_type, tag_id in matches:
-            tags.append((text, tag_type))
+            self._server_url = ayon_api.get_base_url().rstrip('/')
+        return self._server_url
 
-        return tags
+    def _process_comment_body(self, body):
+        """Convert markdown tags to clickable HTML links and collect them.
 
-    def _extract_message(self, body):
-        """Convert markdown tags to clickable HTML links with uniform blue color."""
-        import re
-        import ayon_api
+        Both results come from one pass over the body.
 
-        # Get AYON server URL
-        server_url = ayon_api.get_base_url()
-        if server_url.endswith('/'):
-            server_url = server_url[:-1]
+        Returns:
+            tuple: (HTML message, list of (tag_text, tag_type) tuples)
+        """
+        tags = []
+        server_url = self._get_server_url()
+        project_name = self.parent.project_name
 
         def replace_tag(match):
             text = match.group(1)
             tag_type = match.group(2)
             tag_id = match.group(3)
+            tags.append((text, tag_type))
 
             # Uniform blue color for all tags (matching web UI)
             color = '#5b9dd9'
@@ -397,50 +525,27 @@ class ActivityDisplayManager:
             # Add icons for version and task (matching web UI)
             if tag_type == 'version':
                 icon = '🔷'  # Diamond icon for versions
-                url = f"{server_url}/projects/{self.parent.project_name}/overview?project={self.parent.project_name}&type=version&id={tag_id}"
+                url = f"{server_url}/projects/{project_name}/overview?project={project_name}&type=version&id={tag_id}"
             elif tag_type == 'task':
                 icon = '📋'  # Clipboard icon for tasks
-                url = f"{server_url}/projects/{self.parent.project_name}/overview?project={self.parent.project_name}&type=task&id={tag_id}"
+                url = f"{server_url}/projects/{project_name}/overview?project={project_name}&type=task&id={tag_id}"
             else:
                 # Fallback for unknown types
                 return f'<span style="color: {color};">{text}</span>'
 
             return f'<a href="{url}" style="color: {color}; text-decoration: none;">{icon} {text}</a>'
 
-        pattern = r'\[([^\]]+)\]\(([^:]+):([^\)]+)\)'
-        message = re.sub(pattern, replace_tag, body)
-        return message.strip()
-
-    def _show_image_preview(self, image_data, file_id):
-        """Show image preview dialog."""
-        dialog = QDialog(self.parent)
-        dialog.setWindowTitle(f"Preview - {file_id}")
-        dialog.setWindowModality(Qt.ApplicationModal)
-        dialog.resize(800, 600)
-
-        layout = QVBoxLayout(dialog)
-        label = QLabel()
-        label.setAlignment(Qt.AlignCenter)
-
-        pixmap = QPixmap()
-        if pixmap.loadFromData(base64.b64decode(image_data)):
-            label.setPixmap(pixmap.scaled(750, 550, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        else:
-            label.setText("Failed to load image")
-
-        layout.addWidget(label)
-
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(dialog.accept)
-        layout.addWidget(close_btn)
-
-        dialog.exec_()
+        message = _TAG_RE.sub(replace_tag, body)
+        return message.strip(), tags
 
     def clear(self):
         """Clear activity display and reset state."""
         self.renderer.clear()
-        self.activity_images.clear()
-        self.all_activities = []
+        self.activity_images = {}
+        self.all_activities = deque()
+        self._activity_indexes = {}
+        # Drop results of fetches still running for the cleared version
+        self.current_fetch_version += 1
 
         # Reset pagination state
         self._has_previous_page = False
@@ -451,22 +556,20 @@ class ActivityDisplayManager:
     def _on_checkbox_changed(self, activity_id, body, item_index, state):
         """Handle checklist checkbox change."""
         try:
-            import re
-            lines = body.split('\n')
-            checkbox_count = 0
-
-            for i, line in enumerate(lines):
-                if re.match(r'\*\s*\[[ x]\]', line.strip()):
-                    if checkbox_count == item_index:
-                        checked = 'x' if state == 2 else ' '
-                        lines[i] = re.sub(r'\*\s*\[[ x]\]', f'* [{checked}]', line)
-                        break
-                    checkbox_count += 1
-
-            new_body = '\n'.join(lines)
+            # Items were parsed for rendering, flip the box in place
+            items = _parse_checklist_items(body)
+            if not 0 <= item_index < len(items):
+                return
+            offset = items[item_index][2]
+            new_body = body[:offset] + ('[x]' if state == 2 else '[ ]') + body[offset + 3:]
 
             if self.activity_service.update_activity(self.parent.project_name, activity_id, new_body):
                 log.info(f"Checklist updated for activity {activity_id}")
+                for activity in self.all_activities:
+                    if activity.get('activityId') == activity_id:
+                        activity['body'] = new_body
+                        activity.pop('_checklist_cached', None)
+                        break
                 self.parent.refresh()
             else:
                 log.error(f"Failed to update checklist for activity {activity_id}", exc_info=True)
@@ -475,8 +578,6 @@ class ActivityDisplayManager:
 
     def _on_scroll(self, value):
         """Load more activities when scrolled to top."""
-        scrollbar = self.renderer.verticalScrollBar()
-
         if value < 100 and not self._is_loading_more and self._has_previous_page:
             self._load_more_activities()
 
@@ -487,9 +588,6 @@ class ActivityDisplayManager:
 
         self._is_loading_more = True
 
-        from ..api.ayon.ayon_client_api import AyonClient
-        client = AyonClient()
-
         version_id = self.parent.current_version_id
         version_data = self.parent.current_version_data
         project_name = self.parent.project_name
@@ -501,28 +599,43 @@ class ActivityDisplayManager:
         if not dcc_mode and task_id and task_id != "N/A":
             entity_ids.append(task_id)
 
-        response = client.get_activities(
-            project_name=project_name,
-            entity_ids=entity_ids,
-            activity_types=['comment', 'status.change', 'version.publish'],
-            dcc_mode=dcc_mode,
-            last=50,
-            before=self._start_cursor
+        self.pagination_worker = PaginationWorker(
+            self.activity_service,
+            {
+                'project_name': project_name,
+                'entity_ids': entity_ids,
+                'activity_types': ['comment', 'status.change', 'version.publish'],
+                'dcc_mode': dcc_mode,
+                'last': 50,
+                'before': self._start_cursor,
+            },
+            self.current_fetch_version,
+            self.parent
         )
+        self.pagination_worker.more_ready.connect(self._on_more_activities)
+        self.pagination_worker.finished.connect(self.pagination_worker.deleteLater)
+        self.pagination_worker.start()
 
-        if response and 'project' in response and response['project']:
-            page_info = response['project'].get('activities', {}).get('pageInfo', {})
-            edges = response['project'].get('activities', {}).get('edges', [])
+    def _on_more_activities(self, edges, page_info, fetch_id):
+        """Prepend page of older activities loaded by pagination worker."""
+        if fetch_id != self.current_fetch_version:
+            # Version changed (or cleared) while the page was loading
+            return
 
-            self._has_previous_page = page_info.get('hasPreviousPage', False)
-            self._start_cursor = page_info.get('startCursor')
+        self._is_loading_more = False
+        if not page_info:
+            return
 
-            older_activities = [edge['node'] for edge in edges if edge.get('node')]
-            self.all_activities = older_activities + self.all_activities
+        self._has_previous_page = page_info.get('hasPreviousPage', False)
+        self._start_cursor = page_info.get('startCursor')
 
-            scrollbar = self.renderer.verticalScrollBar()
-            current_scroll = scrollbar.value()
-            self._apply_filter()
-            scrollbar.setValue(current_scroll + 200)
+        older_activities = [edge['node'] for edge in edges if edge.get('node')]
+        self.all_activities.extendleft(reversed(older_activities))
+        self._index_activities()
 
-        self._is_loading_more = False
+        scrollbar = self.renderer.verticalScrollBar()
+        current_scroll = scrollbar.value()
+        self._apply_filter()
+        # Keep reading position instead of jumping to the newest activity
+        self._pending_scroll = False
+        scrollbar.setValue(current_scroll + 200)
@@ -3,15 +3,143 @@ from __future__ import annotations
 
 import os
 import tempfile
+import time
 
+import ayon_api
 from ayon_core.lib import Logger
 from ayon_core.tools.utils.dialogs import show_message_dialog
 from ayon_core.tools.utils.overlay_messages import MessageOverlayObject
 
 from ..api import AyonClient
+from ..api.ayon.cache import TTLCache
+from ..workers import FutureRelay
+
+try:
+    import rv.commands as rv_commands
+    from pymu import MuSymbol
+
+    RV_AVAILABLE = True
+except ImportError:
+    # Not running inside RV
+    rv_commands = None
+    MuSymbol = None
+    RV_AVAILABLE = False
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+
+    INOTIFY_AVAILABLE = True
+except (ImportError, OSError):
+    # Not installed or not on Linux
+    INOTIFY_AVAILABLE = False
 
 log = Logger.get_logger(__name__)
 
+# Seconds to wait for RV to write exported annotation frames
+_EXPORT_TIMEOUT = 20
+# RAM backed location for exported frames when the system has one
+_EXPORT_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+# Poll interval bounds of the fallback without inotify
+_EXPORT_POLL_MIN = 0.05
+_EXPORT_POLL_MAX = 0.5
+
+# Seconds to wait for version and task lookups before commenting without them
+_LOOKUP_TIMEOUT = 5
+
+# (project_name, entity_id) -> entity, filled while creating comments
+_version_cache = TTLCache(maxsize=256, ttl=300)
+_task_cache = TTLCache(maxsize=256, ttl=300)
+
+
+def _is_valid_task_id(task_id) -> bool:
+    return bool(task_id) and task_id != "N/A"
+
+
+def _get_version(project_name: str, version_id: str):
+    """Get version entity, cached."""
+    key = (project_name, version_id)
+    version = _version_cache.get(key)
+    if version is None:
+        version = ayon_api.get_version_by_id(project_name, version_id)
+        if version:
+            _version_cache.set(key, version)
+    return version
+
+
+def _get_task(project_name: str, task_id: str):
+    """Get task entity, cached."""
+    key = (project_name, task_id)
+    task = _task_cache.get(key)
+    if task is None:
+        task = ayon_api.get_task_by_id(project_name, task_id)
+        if task:
+            _task_cache.set(key, task)
+    return task
+
+
+def _is_export_file(name: str) -> bool:
+    return name.startswith("annotated") and name.endswith(".jpeg")
+
+
+def _list_exports(temp_dir: str) -> list[str]:
+    """Names of exported annotation frames in temp_dir."""
+    try:
+        with os.scandir(temp_dir) as entries:
+            return [entry.name for entry in entries if _is_export_file(entry.name)]
+    except FileNotFoundError:
+        return []
+
+
+def _watch_exports(temp_dir: str):
+    """Start watching temp_dir for finished files, None if unsupported.
+
+    The watch has to exist before the export starts so no file is missed.
+    """
+    if not INOTIFY_AVAILABLE:
+        return None
+    try:
+        inotify = INotify()
+        inotify.add_watch(temp_dir, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+    except OSError as e:
+        log.debug(f"Could not watch {temp_dir}: {e}")
+        return None
+    return inotify
+
+
+def _wait_for_exports(temp_dir: str, expected: int, timeout: float, inotify=None) -> list[str]:
+    """Wait until expected annotation frames are written to temp_dir.
+
+    With inotify a frame counts once RV closed the file, returning as soon
+    as the last one is done. Otherwise the directory is polled with a
+    growing interval.
+
+    Returns:
+        list[str]: Sorted names of exported frames, may be fewer than
+            expected on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    if inotify is not None:
+        done = set()
+        while len(done) < expected:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for event in inotify.read(timeout=int(remaining * 1000)):
+                if _is_export_file(event.name):
+                    done.add(event.name)
+        return sorted(done)
+
+    interval = _EXPORT_POLL_MIN
+    while True:
+        names = _list_exports(temp_dir)
+        if len(names) >= expected:
+            return sorted(names)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return sorted(names)
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, _EXPORT_POLL_MAX)
+
 
 class RVAnnotationExporter:
     """Handles RV annotation extraction and export."""
@@ -19,17 +147,12 @@ class RVAnnotationExporter:
     @staticmethod
     def get_annotation_summary() -> dict:
         """Get summary of annotations in current RV session."""
-        try:
-            import rv.commands as rv_commands
-            from pymu import MuSymbol
-
-            marked_frames = rv_commands.markedFrames()
-            if not marked_frames:
-                mark_frames = MuSymbol('rvui.markAnnotatedFrames')
-                mark_frames()
-                marked_frames = rv_commands.markedFrames()
+        if not RV_AVAILABLE:
+            return {'has_annotations': False}
 
-            text_annotations = RVAnnotationExporter._extract_text_annotations(marked_frames, rv_commands)
+        try:
+            marked_frames = RVAnnotationExporter._get_marked_frames()
+            text_annotations = RVAnnotationExporter._extract_text_annotations(marked_frames)
 
             return {
                 'has_annotations': bool(marked_frames),
@@ -40,38 +163,125 @@ class RVAnnotationExporter:
             log.error(f"Error getting annotation summary: {e}")
             return {'has_annotations': False}
 
+    # (session, view node) last scanned without finding annotations,
+    # reset by any graph change
+    _empty_scan_key = None
+    _graph_change_bound = False
+
+    @classmethod
+    def _on_graph_state_change(cls, event):
+        cls._empty_scan_key = None
+        # Let other handlers see the event too
+        event.reject()
+
+    @classmethod
+    def _bind_graph_change(cls) -> bool:
+        """Bind invalidation of empty scan result, True if bound."""
+        if not cls._graph_change_bound:
+            try:
+                rv_commands.bind(
+                    "default", "global", "graph-state-change",
+                    cls._on_graph_state_change,
+                    "Activity Panel: Invalidate annotation scan"
+                )
+                cls._graph_change_bound = True
+            except Exception as e:
+                log.debug(f"Could not bind graph-state-change: {e}")
+        return cls._graph_change_bound
+
+    @classmethod
+    def _get_marked_frames(cls) -> list[int]:
+        """Get marked frames, marking annotated frames if none are marked.
+
+        Marking walks the whole session, it is skipped if the session did
+        not change since the last scan found nothing.
+        """
+        marked_frames = rv_commands.markedFrames()
+        if marked_frames:
+            return marked_frames
+
+        scan_key = (rv_commands.sessionName(), rv_commands.viewNode())
+        if scan_key == cls._empty_scan_key:
+            return []
+
+        mark_frames = MuSymbol('rvui.markAnnotatedFrames')
+        mark_frames()
+        marked_frames = rv_commands.markedFrames()
+        if not marked_frames and cls._bind_graph_change():
+            cls._empty_scan_key = scan_key
+        return marked_frames
+
     @staticmethod
-    def _extract_text_annotations(marked_frames: list[int], rv_commands) -> str:
+    def _extract_text_annotations(marked_frames: list[int]) -> str:
         """Extract text from marked frames."""
         if not marked_frames:
             return ""
 
-        annotations = []
         frame_offset = rv_commands.frame() - 1
+        paint_props = RVAnnotationExporter._get_paint_properties()
+
+        return "\n".join(
+            f"Frame {frame + frame_offset}: {text}"
+            for frame in marked_frames
+            for text in RVAnnotationExporter._extract_frame_text(frame, paint_props)
+        )
+
+    @staticmethod
+    def _get_paint_properties() -> set[str] | None:
+        """Get names of all paint node properties in one call.
 
-        for frame in marked_frames:
-            texts = RVAnnotationExporter._extract_frame_text(frame, rv_commands)
-            for text in texts:
-                annotations.append(f"Frame {frame + frame_offset}: {text}")
+        Names are without the node part, e.g. "frame:1.order". Returns None
+        if the paint node can't be resolved to a single node or RV can not
+        list its properties, existence is then checked per property.
+        """
+        try:
+            paint_nodes = rv_commands.nodesOfType("RVPaint")
+        except Exception:
+            paint_nodes = []
+        if len(paint_nodes) != 1:
+            log.debug(
+                f"Found {len(paint_nodes)} RVPaint nodes,"
+                " checking paint properties one by one"
+            )
+            return None
 
-        return "\n".join(annotations)
+        try:
+            names = rv_commands.properties(paint_nodes[0])
+        except Exception:
+            names = None
+        if not names:
+            log.debug(
+                f"Could not list properties of {paint_nodes[0]},"
+                " checking paint properties one by one"
+            )
+            return None
+        return {name.split(".", 1)[-1] for name in names}
 
     @staticmethod
-    def _extract_frame_text(frame: int, rv_commands) -> list[str]:
+    def _paint_property_exists(name: str, paint_props: set[str] | None) -> bool:
+        if paint_props is not None:
+            return name in paint_props
+        return rv_commands.propertyExists(f"#RVPaint.{name}")
+
+    @staticmethod
+    def _extract_frame_text(frame: int, paint_props: set[str] | None = None) -> list[str]:
         """Extract text from specific frame."""
         try:
             prop_order = f"#RVPaint.frame:{frame}.order"
-            if not rv_commands.propertyExists(prop_order):
+            if not RVAnnotationExporter._paint_property_exists(f"frame:{frame}.order", paint_props):
                 return []
 
             texts = []
-            items = rv_commands.getStringProperty(prop_order, 0, 2147483647)
+            # Read only the elements the property holds
+            size = rv_commands.propertyInfo(prop_order).get("size", 0)
+            items = rv_commands.getStringProperty(prop_order, 0, size) if size else []
 
             for item in items:
                 if item.startswith("text"):
-                    text_prop = f"#RVPaint.{item}.text"
-                    if rv_commands.propertyExists(text_prop):
-                        text = rv_commands.getStringProperty(text_prop, 0, 2147483647)
+                    if RVAnnotationExporter._paint_property_exists(f"{item}.text", paint_props):
+                        text_prop = f"#RVPaint.{item}.text"
+                        # Only the first element holds the text
+                        text = rv_commands.getStringProperty(text_prop, 0, 1)
                         if text and text[0].strip():
                             texts.append(text[0].strip())
 
@@ -81,57 +291,50 @@ class RVAnnotationExporter:
             return []
 
     @staticmethod
-    def export_annotations() -> list[str]:
-        """Export annotation images to temp directory."""
-        try:
-            import time
-            from pymu import MuSymbol
-            import rv.commands as rv_commands
+    def export_annotations() -> tuple[list[str], tempfile.TemporaryDirectory | None]:
+        """Export annotation images to temp directory.
 
-            marked_frames = rv_commands.markedFrames()
-            if not marked_frames:
-                mark_frames = MuSymbol('rvui.markAnnotatedFrames')
-                mark_frames()
-                marked_frames = rv_commands.markedFrames()
+        Returns:
+            tuple: Exported image paths and temporary directory holding them,
+                the caller cleans it up once images are uploaded. Directory
+                is None if nothing was exported.
+        """
+        if not RV_AVAILABLE:
+            return [], None
 
+        export_dir = None
+        try:
+            marked_frames = RVAnnotationExporter._get_marked_frames()
             if not marked_frames:
                 log.warning("No marked frames to export")
-                return []
+                return [], None
 
-            temp_dir = tempfile.mkdtemp(prefix="ayon_annotations_")
+            export_dir = tempfile.TemporaryDirectory(prefix="ayon_annotations_", dir=_EXPORT_ROOT)
+            temp_dir = export_dir.name
             export_pattern = os.path.join(temp_dir, "annotated.####.jpeg")
 
-            exportframes = MuSymbol("export_utils.exportMarkedFrames")
-            exportframes(export_pattern)
-
             expected_files = len(marked_frames)
-            max_wait = 20
-            wait_interval = 0.5
-            elapsed = 0
-            exported_files = []
-
-            while elapsed < max_wait:
-                time.sleep(wait_interval)
-                elapsed += wait_interval
-
-                if os.path.exists(temp_dir):
-                    files = list(os.listdir(temp_dir))
-                    jpeg_files = [f for f in files if f.startswith("annotated") and f.endswith(".jpeg")]
+            inotify = _watch_exports(temp_dir)
+            try:
+                exportframes = MuSymbol("export_utils.exportMarkedFrames")
+                exportframes(export_pattern)
 
-                    if len(jpeg_files) >= expected_files:
-                        exported_files = [os.path.join(temp_dir, f) for f in sorted(jpeg_files)]
-                        break
+                jpeg_files = _wait_for_exports(temp_dir, expected_files, _EXPORT_TIMEOUT, inotify)
+            finally:
+                if inotify is not None:
+                    inotify.close()
 
-            if not exported_files:
-                log.warning(
-                    f"Expected {expected_files} files, found {len(jpeg_files) if 'jpeg_files' in locals() else 0}")
+            if len(jpeg_files) < expected_files:
+                log.warning(f"Expected {expected_files} files, found {len(jpeg_files)}")
+                export_dir.cleanup()
+                return [], None
 
-            return exported_files
+            return [os.path.join(temp_dir, f) for f in jpeg_files], export_dir
         except Exception as e:
-            log.error(f"Error exporting annotations: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+            log.error(f"Error exporting annotations: {e}", exc_info=True)
+            if export_dir is not None:
+                export_dir.cleanup()
+            return [], None
 
 
 class CommentManager:
@@ -140,9 +343,26 @@ class CommentManager:
     def __init__(self, parent_widget):
         self.parent = parent_widget
         self.ayon_client = AyonClient()
+        self._io_pool = None
+
+    def _get_io_pool(self):
+        """Get or lazily create pool for entity lookups and uploads."""
+        if self._io_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="ayon-comment"
+            )
+        return self._io_pool
+
+    @staticmethod
+    def clear_cache():
+        """Drop cached version and task entities."""
+        _version_cache.clear()
+        _task_cache.clear()
 
     def create_comment(self, message, version_data, activity_service, project_name, refresh_callback=None,
-                       screenshot_paths=None, on_success=None):
+                       screenshot_paths=None, on_success=None, on_failure=None):
         """Create comment with RV annotations if available.
         
         Args:
@@ -153,9 +373,15 @@ class CommentManager:
             refresh_callback (callable): Callback to refresh UI after comment.
             screenshot_paths (list): List of screenshot file paths to attach.
             on_success (callable): Callback for cleanup after successful comment.
+            on_failure (callable): Callback called when the upload failed.
+
+        The upload runs in background, on_success and refresh_callback are
+        called on the main thread once the comment was created, on_failure
+        if it was not. Exactly one of on_success and on_failure is called
+        when True is returned.
 
         Returns:
-            bool: True if comment created successfully.
+            bool: True if comment upload started.
         """
         if not message:
             show_message_dialog(
@@ -173,29 +399,14 @@ class CommentManager:
         path = version_data.get('path')
         user_name = version_data.get('author')
 
-        # Fetch version info if version_name or task_id is missing
-        if not version_name or not task_id or task_id == "N/A" or task_id is None:
-            try:
-                import ayon_api
-                version = ayon_api.get_version_by_id(project_name, version_id)
-                if version:
-                    if not version_name:
-                        version_name = version.get('name')
-
-                    # Try to get task_id from version
-                    if not task_id or task_id == "N/A" or task_id is None:
-                        task_id = version.get('taskId')
-            except Exception as e:
-                log.debug(f"Could not fetch version info: {e}")
-
-        # Fetch task_name if missing but task_id exists
-        if task_id and task_id != "N/A" and task_id is not None and not task_name:
-            try:
-                import ayon_api
-                task = ayon_api.get_task_by_id(project_name, task_id)
-                task_name = task.get('name') if task else None
-            except Exception as e:
-                log.debug(f"Could not fetch task name: {e}")
+        # Entity lookups run while RV annotations are extracted
+        pool = self._get_io_pool()
+        version_future = None
+        if not version_name or not _is_valid_task_id(task_id):
+            version_future = pool.submit(_get_version, project_name, version_id)
+        task_future = None
+        if _is_valid_task_id(task_id) and not task_name:
+            task_future = pool.submit(_get_task, project_name, task_id)
 
         # Use AYON's overlay message system
         if not hasattr(self.parent, '_overlay_object'):
@@ -205,15 +416,9 @@ class CommentManager:
         overlay.add_message("Preparing comment...")
 
         annotation_paths = screenshot_paths[:] if screenshot_paths else []
+        export_dir = None
 
-        # Check if RV is available for annotation export
-        try:
-            import rv.commands
-            rv_available = True
-        except ImportError:
-            rv_available = False
-
-        if rv_available:
+        if RV_AVAILABLE:
             try:
                 overlay.add_message("Checking for annotations...")
                 ann_summary = RVAnnotationExporter.get_annotation_summary()
@@ -226,7 +431,7 @@ class CommentManager:
 
                     overlay.add_message("Exporting annotations...")
 
-                    annotation_paths = RVAnnotationExporter.export_annotations()
+                    annotation_paths, export_dir = RVAnnotationExporter.export_annotations()
 
                     if annotation_paths:
                         overlay.add_message(f"Found {len(annotation_paths)} annotation(s)...")
@@ -238,34 +443,77 @@ class CommentManager:
             except Exception as e:
                 log.error(f"Error extracting annotations: {e}", exc_info=True)
 
-        overlay.add_message("Uploading comment...")
+        # Fetch version info if version_name or task_id is missing
+        if version_future is not None:
+            try:
+                version = version_future.result(timeout=_LOOKUP_TIMEOUT)
+                if version:
+                    if not version_name:
+                        version_name = version.get('name')
 
-        try:
-            result = activity_service.create_comment_on_version(
-                project_name,
-                version_id,
-                message,
-                user_name=user_name,
-                file_paths=annotation_paths,
-                task_id=task_id,
-                task_name=task_name,
-                path=path,
-                version_name=version_name
-            )
+                    # Try to get task_id from version
+                    if not _is_valid_task_id(task_id):
+                        task_id = version.get('taskId')
+            except Exception as e:
+                log.debug(f"Could not fetch version info: {e}")
+
+        # Fetch task_name if missing but task_id exists
+        if task_future is None and _is_valid_task_id(task_id) and not task_name:
+            task_future = pool.submit(_get_task, project_name, task_id)
+        if task_future is not None:
+            try:
+                task = task_future.result(timeout=_LOOKUP_TIMEOUT)
+                task_name = task.get('name') if task else None
+            except Exception as e:
+                log.debug(f"Could not fetch task name: {e}")
 
-            if result is not None:
-                overlay.add_message("✓ Comment created successfully!", message_type="success")
+        overlay.add_message("Uploading comment...")
 
-                if on_success:
-                    on_success()
-                if refresh_callback:
-                    refresh_callback()
-                return True
-            else:
-                overlay.add_message("Failed to create comment", message_type="error")
-                return False
+        # Upload off the GUI thread, result is handled on the main thread
+        future = self._get_io_pool().submit(
+            activity_service.create_comment_on_version,
+            project_name,
+            version_id,
+            message,
+            user_name=user_name,
+            file_paths=annotation_paths,
+            task_id=task_id,
+            task_name=task_name,
+            path=path,
+            version_name=version_name
+        )
+        if export_dir is not None:
+            # Exported frames are not needed once the upload finished
+            future.add_done_callback(lambda _future: export_dir.cleanup())
+        FutureRelay(
+            future,
+            on_done=lambda result: self._on_comment_uploaded(
+                result, overlay, on_success, on_failure, refresh_callback
+            ),
+            on_error=lambda exc: self._on_comment_failed(exc, overlay, on_failure),
+            parent=self.parent
+        )
+        return True
 
-        except Exception as e:
-            log.error(f"Failed to create comment: {e}", exc_info=True)
-            overlay.add_message(f"Failed to create comment: {str(e)}", message_type="error")
-            return False
+    @staticmethod
+    def _on_comment_uploaded(result, overlay, on_success, on_failure, refresh_callback):
+        """Finish comment creation after upload."""
+        if result is None:
+            overlay.add_message("Failed to create comment", message_type="error")
+            if on_failure:
+                on_failure()
+            return
+
+        overlay.add_message("✓ Comment created successfully!", message_type="success")
+        if on_success:
+            on_success()
+        if refresh_callback:
+            refresh_callback()
+
+    @staticmethod
+    def _on_comment_failed(exc, overlay, on_failure):
+        """Report failed comment upload."""
+        log.error(f"Failed to create comment: {exc}", exc_info=exc)
+        overlay.add_message(f"Failed to create comment: {str(exc)}", message_type="error")
+        if on_failure:
+            on_failure()
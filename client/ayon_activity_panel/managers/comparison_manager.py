@@ -1,11 +1,16 @@
 """Version comparison manager for RV."""
-from pathlib import Path
+import os
 
 from ayon_core.lib import Logger
 
 log = Logger.get_logger(__name__)
 
 
+def _get_ext(path):
+    """Lowercase extension of path, empty string if there is none."""
+    return os.path.splitext(path or '')[1].lower()
+
+
 class ComparisonManager:
     """Manages version comparison in RV."""
 
@@ -41,20 +46,25 @@ class ComparisonManager:
                 log.warning("No matching representation for comparison")
                 return
 
+            old_rep = None if old_source_group else self._get_representation(old_version_data)
+
+            # Entities of both versions are fetched together
+            contexts = self._get_load_contexts(
+                project_name, [rep for rep in (new_rep, old_rep) if rep]
+            )
+
             # Load new version using official loader
             new_source_group = self._load_version_with_loader(
-                project_name, new_version_id, new_rep, MovLoader, FramesLoader
+                contexts.get(new_rep.get('id')), new_rep, MovLoader, FramesLoader
             )
             if not new_source_group:
                 return
 
             # Load old version if not found
-            if not old_source_group:
-                old_rep = self._get_representation(old_version_data)
-                if old_rep:
-                    old_source_group = self._load_version_with_loader(
-                        project_name, old_version_id, old_rep, MovLoader, FramesLoader
-                    )
+            if old_rep:
+                old_source_group = self._load_version_with_loader(
+                    contexts.get(old_rep.get('id')), old_rep, MovLoader, FramesLoader
+                )
 
             if old_source_group and new_source_group:
                 self._create_rv_comparison(old_source_group, new_source_group, old_version_data, new_version_data)
@@ -86,20 +96,15 @@ class ComparisonManager:
 
     def _get_matching_representation(self, old_version_data, new_version_data):
         """Get representation matching old version's extension."""
-        old_path = old_version_data.get('current_representation_path', '')
-        old_ext = Path(old_path).suffix.lower() if old_path else None
+        old_ext = _get_ext(old_version_data.get('current_representation_path'))
 
         new_reps = new_version_data.get('representations', [])
         if not new_reps:
             return None
 
-        # Match by extension
+        # Match by extension, fallback to first
         if old_ext:
-            for rep in new_reps:
-                if Path(rep.get('path', '')).suffix.lower() == old_ext:
-                    return rep
-
-        # Fallback to first
+            return next((rep for rep in new_reps if _get_ext(rep.get('path')) == old_ext), new_reps[0])
         return new_reps[0]
 
     def _get_representation(self, version_data):
@@ -107,31 +112,59 @@ class ComparisonManager:
         reps = version_data.get('representations', [])
         return reps[0] if reps else None
 
-    def _load_version_with_loader(self, project_name, version_id, rep, MovLoader, FramesLoader):
-        """Load version using official loader."""
+    def _get_load_contexts(self, project_name, reps):
+        """Get loader contexts of representations.
+
+        Representations and all their parents are fetched in two queries
+        for all representations at once, instead of one request per entity.
+
+        Returns:
+            dict: Representation id to loader context.
+        """
+        rep_ids = {rep.get('id') for rep in reps if rep.get('id')}
+        if not rep_ids:
+            return {}
+
         try:
             import ayon_api
-            import rv.commands as commands
 
-            rep_id = rep.get('id')
-            if not rep_id:
-                return None
-
-            project = ayon_api.get_project(project_name)
-            representation = ayon_api.get_representation_by_id(project_name, rep_id)
-            version = ayon_api.get_version_by_id(project_name, version_id)
-            product = ayon_api.get_product_by_id(project_name, version['productId'])
-            folder = ayon_api.get_folder_by_id(project_name, product['folderId'])
-
-            context = {
-                'project': project,
-                'folder': folder,
-                'product': product,
-                'version': version,
+            representations = {
+                representation['id']: representation
+                for representation in ayon_api.get_representations(
+                    project_name, representation_ids=rep_ids
+                )
+            }
+            parents_by_id = ayon_api.get_representations_parents(project_name, rep_ids)
+        except Exception as e:
+            log.error(f"Failed to get representation contexts: {e}")
+            return {}
+
+        contexts = {}
+        for rep_id, representation in representations.items():
+            parents = parents_by_id.get(rep_id)
+            if not parents or not parents.version:
+                continue
+            contexts[rep_id] = {
+                'project': parents.project,
+                'folder': parents.folder,
+                'product': parents.product,
+                'version': parents.version,
                 'representation': representation
             }
+        return contexts
+
+    def _load_version_with_loader(self, context, rep, MovLoader, FramesLoader):
+        """Load version using official loader."""
+        if not context:
+            return None
+
+        try:
+            import rv.commands as commands
+
+            product = context['product']
+            folder = context['folder']
 
-            ext = Path(rep.get('path', '')).suffix.lower()
+            ext = _get_ext(rep.get('path'))
             loader_class = MovLoader if ext in ['.mov', '.mp4'] else FramesLoader
             loader = loader_class(context)
             loader.load(context, name=product['name'], namespace=folder['name'])
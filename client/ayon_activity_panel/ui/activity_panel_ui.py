@@ -22,6 +22,7 @@ class ActivityPanelUI:
         self.authorLabel = None
         self.authorLineEdit = None
         self.contentTabWidget = None
+        self.activityFilterBar = None
         self.allActivityButton = None
         self.commentsButton = None
         self.publishedVersionsButton = None
@@ -109,7 +110,10 @@ class ActivityPanelUI:
         activity_layout = QtWidgets.QVBoxLayout(activity_tab)
 
         # Filter buttons
-        filter_layout = QtWidgets.QHBoxLayout()
+        self.activityFilterBar = QtWidgets.QWidget()
+        self.activityFilterBar.setObjectName("activityFilterBar")
+        filter_layout = QtWidgets.QHBoxLayout(self.activityFilterBar)
+        filter_layout.setContentsMargins(0, 0, 0, 0)
         filter_layout.setSpacing(2)
 
         self.allActivityButton = QtWidgets.QPushButton()
@@ -144,7 +148,7 @@ class ActivityPanelUI:
         # Activity browser
         self.textBrowser_activity_panel = QtWidgets.QTextBrowser()
 
-        activity_layout.addLayout(filter_layout)
+        activity_layout.addWidget(self.activityFilterBar)
         activity_layout.addWidget(self.textBrowser_activity_panel)
 
         # Representations Tab
@@ -1,14 +1,14 @@
 """Annotations dialog for navigating through activity thumbnails."""
 
-import base64
-
 from qtpy.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QWidget
 )
 from qtpy.QtCore import Qt
-from qtpy.QtGui import QPixmap, QKeyEvent
+from qtpy.QtGui import QKeyEvent
 from ayon_core import style
 
+from .pixmap_cache import get_scaled_pixmap
+
 
 class AnnotationsDialog(QDialog):
     """Dialog for viewing and navigating through multiple annotations."""
@@ -17,7 +17,7 @@ class AnnotationsDialog(QDialog):
         """Initialize annotations dialog.
         
         Args:
-            images: List of tuples (file_id, filename, image_data_base64)
+            images: List of tuples (file_id, filename, image_bytes)
             current_index: Index of annotation to show initially
             parent: Parent widget
         """
@@ -90,14 +90,12 @@ class AnnotationsDialog(QDialog):
         file_id, filename, img_data = self.images[self.current_index]
 
         # Load and display image
-        pixmap = QPixmap()
-        if pixmap.loadFromData(base64.b64decode(img_data)):
-            scaled_pixmap = pixmap.scaled(
-                self.image_label.width() - 10,
-                self.image_label.height() - 10,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+        scaled_pixmap = get_scaled_pixmap(
+            file_id, img_data,
+            self.image_label.width() - 10,
+            self.image_label.height() - 10
+        )
+        if not scaled_pixmap.isNull():
             self.image_label.setPixmap(scaled_pixmap)
         else:
             self.image_label.setText("Failed to load annotation")
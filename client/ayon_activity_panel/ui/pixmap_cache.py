@@ -0,0 +1,74 @@
+"""Decoded pixmap cache for activity attachments."""
+from qtpy.QtCore import Qt
+from qtpy.QtGui import QPixmap, QPixmapCache
+
+# Cache limit is in KiB and shared with the host application, never shrink it
+_CACHE_LIMIT_KB = 64 * 1024
+if QPixmapCache.cacheLimit() < _CACHE_LIMIT_KB:
+    QPixmapCache.setCacheLimit(_CACHE_LIMIT_KB)
+
+
+def _find(key):
+    pixmap = QPixmap()
+    try:
+        # PySide: find(key, pixmap) -> bool
+        found = QPixmapCache.find(key, pixmap)
+    except TypeError:
+        # PyQt: find(key) -> QPixmap or None
+        pixmap = QPixmapCache.find(key)
+        found = pixmap is not None and not pixmap.isNull()
+    return pixmap if found else None
+
+
+def find_pixmap(file_id):
+    """Get cached pixmap of an attachment, None if not decoded yet."""
+    return _find(f"ayon-activity-panel/{file_id}")
+
+
+def get_pixmap(file_id, img_data, image=None):
+    """Get decoded pixmap of an attachment.
+
+    Pixmaps are decoded once and kept in the LRU QPixmapCache, image bytes
+    are decoded again only after eviction.
+
+    Args:
+        file_id (str): Attachment file id, used as cache key.
+        img_data (bytes): Encoded image bytes.
+        image (Optional[QImage]): Image already decoded in a background
+            thread, converted instead of decoding img_data.
+
+    Returns:
+        QPixmap: Decoded pixmap, null if data could not be decoded.
+    """
+    key = f"ayon-activity-panel/{file_id}"
+    pixmap = _find(key)
+    if pixmap is None:
+        if image is not None and not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+        else:
+            pixmap = QPixmap()
+            pixmap.loadFromData(img_data)
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def get_scaled_pixmap(file_id, img_data, width, height):
+    """Get attachment pixmap smoothly scaled to fit width x height.
+
+    Scaled pixmaps are cached per size next to the full resolution one, so
+    reopening a preview does not resample the image again.
+
+    Returns:
+        QPixmap: Scaled pixmap, null if data could not be decoded.
+    """
+    key = f"ayon-activity-panel/{file_id}@{width}x{height}"
+    scaled = _find(key)
+    if scaled is None:
+        scaled = get_pixmap(file_id, img_data)
+        if not scaled.isNull():
+            scaled = scaled.scaled(
+                width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            QPixmapCache.insert(key, scaled)
+    return scaled
@@ -121,6 +121,12 @@ class ActivityPanel(QtWidgets.QWidget):
         self._refresh_timer.timeout.connect(self._on_auto_refresh)
         self._refresh_timer.start(refresh_interval)
 
+        # Coalesces refresh requests fired within one burst of UI events
+        self._pending_refresh_timer = QtCore.QTimer(self)
+        self._pending_refresh_timer.setSingleShot(True)
+        self._pending_refresh_timer.setInterval(50)
+        self._pending_refresh_timer.timeout.connect(self._controller.refresh)
+
     def _init_managers(self):
         """Initialize manager instances."""
         from .managers import (
@@ -168,6 +174,9 @@ class ActivityPanel(QtWidgets.QWidget):
         self._controller.register_event_callback(
             "version.changed", self._on_controller_version_changed
         )
+        self._controller.register_event_callback(
+            "version.refreshing", self._on_controller_version_refreshing
+        )
         self._controller.register_event_callback(
             "version.refreshed", self._on_controller_version_refreshed
         )
@@ -202,8 +211,11 @@ class ActivityPanel(QtWidgets.QWidget):
         self._controller.set_version(version_id, version_data, project_name)
 
     def refresh(self):
-        """Refresh current version data and activities."""
-        self._controller.refresh()
+        """Schedule refresh of current version data and activities.
+
+        Calls made in quick succession result in a single refresh.
+        """
+        self._pending_refresh_timer.start()
 
     def clear(self):
         """Clear all UI components."""
@@ -217,7 +229,7 @@ class ActivityPanel(QtWidgets.QWidget):
 
     def set_available_statuses(self, statuses: list[dict[str, Any]]):
         """Set available statuses (for external code compatibility)."""
-        self._controller._available_statuses = statuses
+        self._controller._available_statuses = tuple(statuses)
         version_data = self._controller.get_current_version_data()
         if version_data:
             dcc_mode = 'version_id' not in version_data
@@ -239,7 +251,7 @@ class ActivityPanel(QtWidgets.QWidget):
         return self._controller.get_current_version_data()
 
     @property
-    def available_statuses(self) -> list[dict[str, Any]]:
+    def available_statuses(self) -> tuple[dict[str, Any], ...]:
         return self._controller.get_available_statuses()
 
     # -------------------------------------------------------------------------
@@ -259,10 +271,18 @@ class ActivityPanel(QtWidgets.QWidget):
         )
         self.version_changed.emit(version_id, version_data)
 
+    def _on_controller_version_refreshing(self, event: dict):
+        """Start activities fetch while controller refreshes version data."""
+        self.activity_display_mgr.fetch_and_display(
+            event.get("version_id"),
+            event.get("version_data"),
+            self._controller.get_project_name(),
+            self._controller.get_available_statuses()
+        )
+
     def _on_controller_version_refreshed(self, event: dict):
         """Handle version refreshed event from controller."""
         version_data = event.get("version_data")
-        version_id = event.get("version_id")
         statuses = self._controller.get_available_statuses()
 
         if version_data:
@@ -270,10 +290,6 @@ class ActivityPanel(QtWidgets.QWidget):
             self.version_details_mgr.update(version_data, statuses, dcc_mode)
             self.representation_mgr.update_tab(version_data)
 
-        self.activity_display_mgr.fetch_and_display(
-            version_id, version_data, self._controller.get_project_name(), statuses
-        )
-
     def _on_controller_cleared(self, event: dict):
         """Handle cleared event from controller."""
         self.activity_display_mgr.clear()
@@ -285,12 +301,13 @@ class ActivityPanel(QtWidgets.QWidget):
     # -------------------------------------------------------------------------
     def _on_refresh_clicked(self):
         """Handle manual refresh button click."""
-        self._controller.refresh()
+        self.comment_manager.clear_cache()
+        self.refresh()
 
     def _on_auto_refresh(self):
         """Handle auto-refresh timer."""
         if self._controller.get_current_version_id():
-            self._controller.refresh()
+            self.refresh()
 
     def _on_comment_clicked(self):
         """Handle comment button click - delegate to CommentManager."""
@@ -304,16 +321,30 @@ class ActivityPanel(QtWidgets.QWidget):
         if not message:
             return
 
+        # Snapshot what is sent, the panel stays usable during the upload
+        comment_text = self.ui.textEdit_comment.toPlainText()
+        # The upload owns the screenshot files until it finished
+        screenshot_paths, screenshot_dir = self.screenshot_handler.take_screenshots()
+        self._set_comment_controls_enabled(False)
+
         # Delegate everything to CommentManager (handles RV annotations, API, cleanup)
-        self.comment_manager.create_comment(
+        started = self.comment_manager.create_comment(
             message=message,
             version_data=version_data,
             activity_service=self._controller.activity_service,
             project_name=project_name,
-            refresh_callback=self._controller.refresh,
-            screenshot_paths=self.screenshot_handler.get_screenshot_paths(),
-            on_success=self._on_comment_success
+            refresh_callback=self.refresh,
+            screenshot_paths=screenshot_paths,
+            on_success=lambda: self._on_comment_success(comment_text, screenshot_dir),
+            on_failure=lambda: self._on_comment_failed(screenshot_paths, screenshot_dir)
         )
+        if not started:
+            self._on_comment_failed(screenshot_paths, screenshot_dir)
+
+    def _set_comment_controls_enabled(self, enabled: bool):
+        """Lock comment and screenshot controls while a comment uploads."""
+        self.ui.pushButton_comment.setEnabled(enabled)
+        self.screenshot_btn.setEnabled(enabled)
 
     def _get_formatted_comment(self) -> str:
         """Get comment text with @mentions formatted."""
@@ -323,14 +354,23 @@ class ActivityPanel(QtWidgets.QWidget):
             return ""
         return re.sub(r'@(\w+)', lambda m: f"[{m.group(1)}](user:{m.group(1)})", message)
 
-    def _on_comment_success(self):
+    def _on_comment_success(self, comment_text: str, screenshot_dir: Optional[str]):
         """Cleanup after successful comment - called by CommentManager."""
-        self.ui.textEdit_comment.clear()
-        self.screenshot_handler.clear_screenshots()
+        self._set_comment_controls_enabled(True)
+        # Keep text typed while the comment was uploading
+        if self.ui.textEdit_comment.toPlainText() == comment_text:
+            self.ui.textEdit_comment.clear()
+        self.screenshot_handler.discard_screenshots(screenshot_dir)
         version_id = self._controller.get_current_version_id()
         if version_id:
             self.comment_created.emit(version_id)
 
+    def _on_comment_failed(self, screenshot_paths: list[str], screenshot_dir: Optional[str]):
+        """Unlock comment controls after failed upload - called by CommentManager."""
+        self._set_comment_controls_enabled(True)
+        # Keep screenshots attached so the comment can be sent again
+        self.screenshot_handler.restore_screenshots(screenshot_paths, screenshot_dir)
+
     def _on_status_changed(self, new_status: str):
         """Handle status change from UI."""
         version_data = self._controller.get_current_version_data()
@@ -341,7 +381,7 @@ class ActivityPanel(QtWidgets.QWidget):
         entity_id = version_data.get('task_id' if dcc_mode else 'version_id', '')
 
         if entity_id and self._controller.update_version_status(entity_id, new_status, is_task=dcc_mode):
-            self._controller.refresh()
+            self.refresh()
 
     def _on_version_changed(self, new_version: str):
         """Handle version change from dropdown."""
@@ -397,4 +437,5 @@ class ActivityPanel(QtWidgets.QWidget):
         self._save_splitter_sizes()
         if hasattr(self, '_refresh_timer'):
             self._refresh_timer.stop()
+            self._pending_refresh_timer.stop()
         super().closeEvent(event)
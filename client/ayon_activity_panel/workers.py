@@ -1,11 +1,12 @@
-from qtpy.QtCore import QThread, Signal
+from qtpy.QtCore import QObject, QThread, Signal, Slot
+from qtpy.QtGui import QImage
 
 
 class ActivityWorker(QThread):
     """Background worker for fetching activities"""
 
     activities_ready = Signal(dict, int)  # activities_data, fetch_id
-    image_ready = Signal(tuple)  # (activity_index, file_id, img_data)
+    image_ready = Signal(tuple)  # (activity_id, file_id, filename, qimage)
 
     def __init__(self, activity_service, version_id, task_id, path, fetch_id, status_colors, version_data, parent=None):
         super().__init__(parent)
@@ -38,7 +39,14 @@ class ActivityWorker(QThread):
                 if event_type == "activities_ready":
                     self.activities_ready.emit(data, self.fetch_id)
                 elif event_type == "image_ready":
-                    self.image_ready.emit(data)
+                    # Decode here, on the download thread. QImage can be
+                    # used off the GUI thread, only QPixmap conversion
+                    # is left for the receiver. Bytes stay in the service
+                    # download cache
+                    activity_id, file_id, img_data, filename = data
+                    self.image_ready.emit(
+                        (activity_id, file_id, filename, QImage.fromData(img_data))
+                    )
 
             self.activity_service.process_version_activities_native(
                 project_name,
@@ -53,3 +61,76 @@ class ActivityWorker(QThread):
         except Exception as e:
             import traceback
             traceback.print_exc()
+
+
+class PaginationWorker(QThread):
+    """Background worker for fetching a page of older activities"""
+
+    more_ready = Signal(list, dict, int)  # edges, page_info, fetch_id
+
+    def __init__(self, activity_service, query_kwargs, fetch_id, parent=None):
+        super().__init__(parent)
+        self.activity_service = activity_service
+        self.query_kwargs = query_kwargs
+        self.fetch_id = fetch_id
+
+    def run(self):
+        edges = []
+        page_info = {}
+        try:
+            response = self.activity_service.get_activities(**self.query_kwargs)
+            if response and response.get('project'):
+                activities = response['project'].get('activities') or {}
+                edges = activities.get('edges') or []
+                page_info = activities.get('pageInfo') or {}
+        except Exception:
+            import traceback
+            traceback.print_exc()
+
+        # Always emit so the receiver can release its loading flag
+        self.more_ready.emit(edges, page_info, self.fetch_id)
+
+
+class FutureRelay(QObject):
+    """Deliver a concurrent.futures.Future result on the Qt main thread.
+
+    Signals are emitted from the pool thread and connected to slots of the
+    relay, which lives in the thread that created it, so Qt queues them and
+    the callbacks never touch widgets from a background thread. Create the
+    relay on the main thread. It deletes itself once the result was
+    delivered.
+    """
+
+    finished = Signal(object)  # result
+    failed = Signal(object)  # exception
+
+    def __init__(self, future, on_done=None, on_error=None, parent=None):
+        super().__init__(parent)
+        self._on_done = on_done
+        self._on_error = on_error
+        self.finished.connect(self._deliver_result)
+        self.failed.connect(self._deliver_error)
+        future.add_done_callback(self._on_future_done)
+
+    def _on_future_done(self, future):
+        exc = future.exception()
+        if exc is not None:
+            self.failed.emit(exc)
+        else:
+            self.finished.emit(future.result())
+
+    @Slot(object)
+    def _deliver_result(self, result):
+        try:
+            if self._on_done is not None:
+                self._on_done(result)
+        finally:
+            self.deleteLater()
+
+    @Slot(object)
+    def _deliver_error(self, exc):
+        try:
+            if self._on_error is not None:
+                self._on_error(exc)
+        finally:
+            self.deleteLater()
@@ -0,0 +1,78 @@
+"""Comment upload failure handling of the activity panel."""
+import functools
+import unittest
+from importlib.util import find_spec
+from unittest import mock
+
+HAS_DEPENDENCIES = all(
+    find_spec(module_name) is not None
+    for module_name in ("qtpy", "ayon_core", "ayon_api")
+)
+
+
+def _run_relay_now(future, on_done=None, on_error=None, parent=None):
+    """Deliver future result synchronously instead of through Qt."""
+    try:
+        result = future.result(timeout=10)
+    except Exception as exc:
+        on_error(exc)
+    else:
+        on_done(result)
+
+
+@unittest.skipUnless(HAS_DEPENDENCIES, "qtpy, ayon_core and ayon_api are required")
+class CommentUploadFailureTests(unittest.TestCase):
+    def _make_panel(self, activity_service):
+        from ayon_activity_panel.managers import comment_manager
+        from ayon_activity_panel.widget import ActivityPanel
+
+        panel = mock.Mock()
+        panel._controller.get_current_version_data.return_value = {
+            "version_id": "version-1",
+            "current_version": "v001",
+            "task_id": "task-1",
+            "task_name": "compositing",
+        }
+        panel._controller.get_project_name.return_value = "project"
+        panel._controller.activity_service = activity_service
+        panel._get_formatted_comment.return_value = "Looks good"
+        panel.ui.textEdit_comment.toPlainText.return_value = "Looks good"
+        panel.screenshot_handler.take_screenshots.return_value = (
+            ["/tmp/ayon_ss_test/0001.png"], "/tmp/ayon_ss_test"
+        )
+        for name in (
+            "_set_comment_controls_enabled",
+            "_on_comment_success",
+            "_on_comment_failed",
+        ):
+            setattr(panel, name, functools.partial(getattr(ActivityPanel, name), panel))
+
+        with mock.patch.object(comment_manager, "AyonClient"):
+            panel.comment_manager = comment_manager.CommentManager(panel)
+        return panel
+
+    def test_failed_activity_restores_screenshots(self):
+        from ayon_activity_panel.api.ayon.activity_service import ActivityService
+        from ayon_activity_panel.managers import comment_manager
+        from ayon_activity_panel.widget import ActivityPanel
+
+        service = ActivityService()
+        service.ayon_connection = mock.Mock()
+        service.ayon_connection.create_activity.side_effect = RuntimeError("server down")
+        panel = self._make_panel(service)
+
+        with mock.patch.object(service, "_upload_files", return_value=["file-1"]), \
+                mock.patch.object(comment_manager, "RV_AVAILABLE", False), \
+                mock.patch.object(comment_manager, "MessageOverlayObject"), \
+                mock.patch.object(comment_manager, "FutureRelay", _run_relay_now):
+            ActivityPanel._on_comment_clicked(panel)
+
+        panel.screenshot_handler.restore_screenshots.assert_called_once_with(
+            ["/tmp/ayon_ss_test/0001.png"], "/tmp/ayon_ss_test"
+        )
+        panel.screenshot_handler.discard_screenshots.assert_not_called()
+        panel.ui.textEdit_comment.clear.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+"""Importing ayon_activity_panel must not load heavy dependencies."""
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+CLIENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("qtpy", "ayon_core", "ayon_api")
+
+_PROBE = (
+    "import json, sys, ayon_activity_panel;"
+    "print(json.dumps(sorted(sys.modules)))"
+)
+
+
+class PackageImportTests(unittest.TestCase):
+    def test_import_does_not_load_heavy_modules(self):
+        # Fresh interpreter, modules imported by the test runner don't count
+        output = subprocess.check_output(
+            [sys.executable, "-c", _PROBE], cwd=CLIENT_DIR
+        )
+        loaded = set(json.loads(output))
+        for module_name in HEAVY_MODULES:
+            self.assertNotIn(module_name, loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()